@@ -0,0 +1,93 @@
+"""
+compare_profiles.py - Per-test time with and without the fast launch profile
+
+Runs the same pytest selection once per profile, reads the JUnit XML
+timings and prints a per-test comparison. Results are also written to
+reports/profile_comparison.json.
+
+Usage:
+    python benchmarks/compare_profiles.py                 # whole suite
+    python benchmarks/compare_profiles.py -m smoke        # any extra pytest args
+    python benchmarks/compare_profiles.py --profiles default fast --repeat 3 -m smoke
+
+For stable numbers run against the local storefront ([storefront] use_local = true).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
+
+
+def run_suite(profile: str, run: int, pytest_args: List[str]) -> Dict[str, float]:
+    """Run pytest with a profile and return {test id: seconds}"""
+    junit_path = os.path.join(REPORTS_DIR, f"profile-{profile}-{run}.xml")
+    command = [
+        sys.executable, "-m", "pytest",
+        f"--profile={profile}",
+        f"--junitxml={junit_path}",
+        "-p", "no:cacheprovider",
+        "-q",
+    ] + pytest_args
+    print(f"[{profile} #{run + 1}] {' '.join(command[2:])}")
+    subprocess.run(command, cwd=PROJECT_ROOT, check=False)
+    
+    timings = {}
+    for case in ET.parse(junit_path).getroot().iter("testcase"):
+        if case.find("skipped") is None:
+            test_id = f"{case.get('classname')}::{case.get('name')}"
+            timings[test_id] = float(case.get("time", 0))
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare browser launch profiles")
+    parser.add_argument("--profiles", nargs="+", default=["default", "fast"])
+    parser.add_argument("--repeat", type=int, default=1, help="runs per profile (median is reported)")
+    args, pytest_args = parser.parse_known_args()
+    
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    samples: Dict[str, Dict[str, List[float]]] = {}
+    for profile in args.profiles:
+        samples[profile] = {}
+        for run in range(args.repeat):
+            for test_id, seconds in run_suite(profile, run, pytest_args).items():
+                samples[profile].setdefault(test_id, []).append(seconds)
+    
+    medians = {
+        profile: {test_id: statistics.median(values) for test_id, values in tests.items()}
+        for profile, tests in samples.items()
+    }
+    test_ids = sorted(set().union(*(tests.keys() for tests in medians.values())))
+    
+    header = f"{'test':<70}" + "".join(f"{profile:>12}" for profile in args.profiles)
+    print()
+    print(header)
+    print("-" * len(header))
+    for test_id in test_ids:
+        row = "".join(f"{medians[profile].get(test_id, float('nan')):>11.2f}s" for profile in args.profiles)
+        print(f"{test_id[-70:]:<70}{row}")
+    
+    totals = {profile: sum(tests.values()) for profile, tests in medians.items()}
+    print("-" * len(header))
+    print(f"{'total':<70}" + "".join(f"{totals[profile]:>11.2f}s" for profile in args.profiles))
+    baseline = args.profiles[0]
+    for profile in args.profiles[1:]:
+        if totals[profile]:
+            print(f"{profile} vs {baseline}: {totals[baseline] / totals[profile]:.2f}x")
+    
+    output_path = os.path.join(REPORTS_DIR, "profile_comparison.json")
+    with open(output_path, "w") as output:
+        json.dump({"per_test": medians, "totals": totals, "repeat": args.repeat}, output, indent=2)
+    print(f"\nResults written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+conftest.py - Fixtures for the framework benchmarks
+Benchmarks always run against the bundled local storefront so numbers only
+depend on the framework and the browser, not on the network
+"""
+
+import pytest
+import os
+import sys
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.config_reader import config
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool
+from utils.browser_prespawner import BrowserPrespawner
+from utils.fixture_driver import launch_driver
+from pages.login_page import LoginPage
+from storefront import StorefrontServer
+
+
+@pytest.fixture(scope="session", autouse=True)
+def storefront():
+    """Serve the local storefront and point base_url at it"""
+    server = StorefrontServer(config.storefront_host, 0).start()
+    config.override('settings', 'base_url', server.url)
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Pool used to measure the pooled driver fixture path (instrumented like the tests' pool)"""
+    pool = DriverPool(launch_driver)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser_prespawner():
+    """Pre-spawner used to measure the isolated driver fixture path"""
+    prespawner = BrowserPrespawner(launch_driver).start()
+    yield prespawner
+    prespawner.close()
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """One browser shared by every page-object benchmark"""
+    driver = create_driver()
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def driver(browser):
+    """The shared browser reset to a logged-out state on the base URL"""
+    browser.get(config.base_url)
+    browser.delete_all_cookies()
+    browser.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    browser.get(config.base_url)
+    return browser
+
+
+@pytest.fixture
+def login_page(driver):
+    return LoginPage(driver)
@@ -0,0 +1,105 @@
+"""
+import_time.py - What importing the test suite costs before a single test runs
+
+Imports each target in a fresh interpreter under `python -X importtime`, sums the
+self time of every imported module per top-level package and reports the median
+over the runs, the number of modules loaded (unaffected by machine noise) and
+the wall time of `pytest --collect-only`. Results are written
+to reports/import_time.json; pass an earlier file with --compare to see the change.
+
+Usage:
+    python benchmarks/import_time.py                              # conftest + collection
+    python benchmarks/import_time.py --repeat 10 --targets pages utils.driver_factory
+    python benchmarks/import_time.py --compare reports/import_time-before.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
+
+DEFAULT_TARGETS = ["tests.conftest", "pages.login_page"]
+
+
+def import_log(target: str) -> List[str]:
+    """`-X importtime` output of importing `target` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True
+    )
+    return result.stderr.splitlines()
+
+
+def import_profile(target: str) -> Dict[str, float]:
+    """Import `target` and return {top-level package: self ms}"""
+    packages: Dict[str, float] = {}
+    for line in import_log(target):
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0.0) + int(self_us) / 1000
+    return packages
+
+
+def collect_time(pytest_args: List[str]) -> float:
+    """Wall time of collecting the suite, in ms"""
+    command = [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider"] + pytest_args
+    started = time.perf_counter()
+    subprocess.run(command, cwd=PROJECT_ROOT, capture_output=True, check=False)
+    return (time.perf_counter() - started) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure import and collection time")
+    parser.add_argument("--targets", nargs="+", default=DEFAULT_TARGETS, help="modules to import")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (median is reported)")
+    parser.add_argument("--top", type=int, default=12, help="packages listed per target")
+    parser.add_argument("--compare", help="earlier import_time.json to diff against")
+    args, pytest_args = parser.parse_known_args()
+    
+    results: Dict[str, Dict] = {}
+    for target in args.targets:
+        runs = [import_profile(target) for _ in range(args.repeat)]
+        packages = {
+            package: statistics.median(run.get(package, 0.0) for run in runs)
+            for package in set().union(*runs)
+        }
+        total = statistics.median(sum(run.values()) for run in runs)
+        modules = sum(1 for line in import_log(target) if line.startswith("import time:")) - 1
+        results[target] = {"total_ms": total, "modules": modules, "packages_ms": packages}
+    collect_ms = statistics.median(collect_time(pytest_args) for _ in range(args.repeat))
+    
+    previous = None
+    if args.compare:
+        with open(args.compare) as handle:
+            previous = json.load(handle)
+    
+    for target, result in results.items():
+        before = previous["imports"].get(target) if previous else None
+        print(f"\nimport {target}: {result['total_ms']:.1f} ms, {result['modules']} modules"
+              + (f" (was {before['total_ms']:.1f} ms, {before['modules']} modules)" if before else ""))
+        ranked = sorted(result["packages_ms"].items(), key=lambda item: item[1], reverse=True)
+        for package, ms in ranked[:args.top]:
+            was = f"{before['packages_ms'].get(package, 0.0):>9.1f}" if before else ""
+            print(f"    {package:<30}{ms:>9.1f}{was}")
+    print(f"\npytest --collect-only: {collect_ms:.0f} ms"
+          + (f" (was {previous['collect_ms']:.0f} ms)" if previous else ""))
+    
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    output_path = os.path.join(REPORTS_DIR, "import_time.json")
+    with open(output_path, "w") as output:
+        json.dump({"imports": results, "collect_ms": collect_ms, "repeat": args.repeat}, output, indent=2)
+    print(f"\nResults written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+load_test.py - Many simultaneous shoppers, driven through the page objects
+
+Every virtual user is a thread repeating a scripted journey - built from the same
+page-object methods the tests use - on a headless browser from a shared DriverPool.
+The number of users follows a ramp profile: a list of stages, each moving linearly
+from the previous user count to its own target over its duration. Every step is
+timed; the report gives throughput, per-step p50/p95/p99 latency of the successful
+steps and error rates, printed and written to reports/load_test.json.
+
+Usage:
+    python benchmarks/load_test.py --local                        # 5 users for 60s, local storefront
+    python benchmarks/load_test.py --local --users 20 --ramp-up 30 --duration 120
+    python benchmarks/load_test.py --local --stages 30:10 60:10 30:40 30:0
+    python benchmarks/load_test.py --journey browse --think-time 1 --profile default
+
+A failed step ends the user's journey and counts as an error of that step; the
+browser is reset (or replaced when it broke) and the user starts the next journey.
+Each running user holds one browser, so plan one browser per user of the peak stage.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
+sys.path.insert(0, PROJECT_ROOT)
+
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.config_reader import config
+from utils.driver_factory import create_driver
+from utils.driver_pool import DriverPool, SESSION_ERRORS
+from utils.browser_supervisor import browser_supervisor
+from utils.flow_runner import Step
+from utils.step_retry import step_retry
+
+PRODUCTS = [
+    "Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt",
+    "Sauce Labs Fleece Jacket", "Sauce Labs Onesie",
+]
+
+# How often the user count is adjusted to the ramp profile, in seconds
+TICK = 1.0
+
+
+# =============== JOURNEYS ===============
+
+def checkout_journey(rng: random.Random) -> List[Step]:
+    """Log in through the form, buy one product and finish the order"""
+    product = rng.choice(PRODUCTS)
+    return [
+        Step("log in", lambda driver: LoginPage(driver).login(config.valid_username, config.valid_password)),
+        Step("add to cart", lambda driver: ProductsPage(driver).add_product_to_cart_by_name(product)),
+        Step("go to cart", lambda driver: ProductsPage(driver).go_to_cart()),
+        Step("checkout", lambda driver: CartPage(driver).proceed_to_checkout()),
+        Step("enter details",
+             lambda driver: CheckoutPage(driver).proceed_to_overview("Load", "User", "208001")),
+        Step("finish", lambda driver: CheckoutPage(driver).click_finish()),
+    ]
+
+
+def browse_journey(rng: random.Random) -> List[Step]:
+    """Log in, sort the catalog and fill the cart without buying"""
+    products = rng.sample(PRODUCTS, 2)
+    return [
+        Step("log in", lambda driver: LoginPage(driver).login(config.valid_username, config.valid_password)),
+        Step("sort by price", lambda driver: ProductsPage(driver).sort_by_price_low_to_high()),
+        Step("add to cart", lambda driver: ProductsPage(driver).add_product_to_cart_by_name(products[0])),
+        Step("add to cart", lambda driver: ProductsPage(driver).add_product_to_cart_by_name(products[1])),
+        Step("go to cart", lambda driver: ProductsPage(driver).go_to_cart()),
+    ]
+
+
+JOURNEYS: Dict[str, Callable[[random.Random], List[Step]]] = {
+    "checkout": checkout_journey,
+    "browse": browse_journey,
+}
+
+
+# =============== RAMP PROFILE ===============
+
+def parse_stage(text: str) -> Tuple[float, int]:
+    """"30:10" - reach 10 users over 30 seconds"""
+    try:
+        duration, users = text.split(":")
+        return float(duration), int(users)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Stage '{text}' must be <seconds>:<users>")
+
+
+def target_users(stages: List[Tuple[float, int]], elapsed: float) -> int:
+    """Users the profile asks for `elapsed` seconds into the run"""
+    previous = 0
+    for duration, users in stages:
+        if elapsed < duration:
+            return round(previous + (users - previous) * elapsed / duration)
+        elapsed -= duration
+        previous = users
+    return previous
+
+
+# =============== STATS ===============
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+class LoadStats:
+    """Step and journey timings of all virtual users"""
+    
+    def __init__(self):
+        # Timings of successful steps only - failures (often full timeouts) count as errors
+        self.steps: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+        self.journeys: List[float] = []
+        self.failed_journeys = 0
+        self.timeline: List[Dict] = []
+        self._lock = threading.Lock()
+    
+    def record_step(self, name: str, seconds: float, error: Optional[BaseException]) -> None:
+        with self._lock:
+            timings = self.steps.setdefault(name, [])
+            if error is None:
+                timings.append(seconds)
+            else:
+                step_errors = self.errors.setdefault(name, {})
+                step_errors[type(error).__name__] = step_errors.get(type(error).__name__, 0) + 1
+    
+    def record_journey(self, seconds: float, failed: bool) -> None:
+        with self._lock:
+            if failed:
+                self.failed_journeys += 1
+            else:
+                self.journeys.append(seconds)
+    
+    def sample(self, elapsed: float, users: int) -> None:
+        """One timeline point: running users and journeys finished so far"""
+        with self._lock:
+            self.timeline.append({
+                "t": round(elapsed, 1), "users": users,
+                "journeys": len(self.journeys), "failed": self.failed_journeys,
+            })
+    
+    def report(self, elapsed: float) -> Dict:
+        with self._lock:
+            steps = {}
+            for name, timings in self.steps.items():
+                ordered = sorted(timings)
+                error_count = sum(self.errors.get(name, {}).values())
+                count = len(ordered) + error_count
+                steps[name] = {
+                    "count": count,
+                    "errors": error_count,
+                    "error_rate": error_count / count,
+                    "error_types": self.errors.get(name, {}),
+                    "p50_ms": percentile(ordered, 0.50) * 1000 if ordered else None,
+                    "p95_ms": percentile(ordered, 0.95) * 1000 if ordered else None,
+                    "p99_ms": percentile(ordered, 0.99) * 1000 if ordered else None,
+                }
+            total = len(self.journeys) + self.failed_journeys
+            ordered = sorted(self.journeys)
+            return {
+                "elapsed_s": elapsed,
+                "journeys": len(self.journeys),
+                "failed_journeys": self.failed_journeys,
+                "error_rate": self.failed_journeys / total if total else 0.0,
+                "journeys_per_s": len(self.journeys) / elapsed if elapsed else 0.0,
+                "steps_per_s": sum(step["count"] for step in steps.values()) / elapsed if elapsed else 0.0,
+                "journey_p50_ms": percentile(ordered, 0.50) * 1000 if ordered else None,
+                "journey_p95_ms": percentile(ordered, 0.95) * 1000 if ordered else None,
+                "steps": steps,
+                "timeline": list(self.timeline),
+            }
+
+
+# =============== VIRTUAL USERS ===============
+
+class VirtualUser(threading.Thread):
+    """Repeats a journey on pooled browsers until told to stop"""
+    
+    def __init__(self, number: int, pool: DriverPool, journey: Callable[[random.Random], List[Step]],
+                 stats: LoadStats, think_time: float):
+        super().__init__(name=f"virtual-user-{number}", daemon=True)
+        self.pool = pool
+        self.journey = journey
+        self.stats = stats
+        self.think_time = think_time
+        self.rng = random.Random(number)
+        self.stopping = threading.Event()
+    
+    def run(self) -> None:
+        while not self.stopping.is_set():
+            self.run_journey()
+            self.stopping.wait(self.think_time)
+    
+    def run_journey(self) -> None:
+        try:
+            driver = self.pool.acquire()
+        except SESSION_ERRORS as error:
+            # No browser, no journey - count it and back off before trying again
+            self.stats.record_step("launch browser", 0.0, error)
+            self.stopping.wait(TICK)
+            return
+        
+        failed = False
+        started = time.perf_counter()
+        for step in self.journey(self.rng):
+            step_started = time.perf_counter()
+            try:
+                step.action(driver)
+                error = None
+            except Exception as caught:
+                # Timeouts, missing elements, dead sessions - all are measured failures
+                error = caught
+            self.stats.record_step(step.name, time.perf_counter() - step_started, error)
+            if error is not None:
+                failed = True
+                break
+        self.stats.record_journey(time.perf_counter() - started, failed)
+        
+        # Reset for the next journey; a browser that broke is discarded by the pool
+        self.pool.release(driver)
+
+
+def run_load(journey: str, stages: List[Tuple[float, int]], think_time: float, profile: str) -> Dict:
+    """Follow the ramp profile with virtual users and return the report"""
+    stats = LoadStats()
+    peak = max(users for _, users in stages)
+    pool = DriverPool(lambda: create_driver(profile), size=peak)
+    duration = sum(seconds for seconds, _ in stages)
+    users: List[VirtualUser] = []
+    spawned = 0
+    started = time.perf_counter()
+    
+    try:
+        elapsed = 0.0
+        while elapsed < duration:
+            target = target_users(stages, elapsed)
+            # A stopping user still runs its journey on a browser - it counts until it exits
+            users = [user for user in users if user.is_alive()]
+            while len(users) < target:
+                user = VirtualUser(spawned, pool, JOURNEYS[journey], stats, think_time)
+                spawned += 1
+                user.start()
+                users.append(user)
+            # Users above the target finish their current journey, then stop
+            active = [user for user in users if not user.stopping.is_set()]
+            while len(active) > target:
+                active.pop().stopping.set()
+            stats.sample(elapsed, len(users))
+            time.sleep(TICK)
+            elapsed = time.perf_counter() - started
+    finally:
+        for user in users:
+            user.stopping.set()
+        for user in users:
+            user.join()
+        pool.close()
+    
+    report = stats.report(time.perf_counter() - started)
+    report.update({"journey": journey, "stages": stages, "think_time": think_time,
+                   "profile": profile, "step_retries": len(step_retry.drain()),
+                   "browser_memory": browser_supervisor.stats()})
+    return report
+
+
+# =============== OUTPUT ===============
+
+def print_report(report: Dict) -> None:
+    header = f"{'step':<18}{'count':>8}{'errors':>8}{'err %':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    print()
+    print(header)
+    print("-" * len(header))
+    for name, step in report["steps"].items():
+        latency = "".join(f"{step[key]:>10.0f}" if step[key] is not None else f"{'-':>10}"
+                          for key in ("p50_ms", "p95_ms", "p99_ms"))
+        print(f"{name:<18}{step['count']:>8}{step['errors']:>8}{step['error_rate'] * 100:>7.1f}%{latency}")
+        for error_type, count in step["error_types"].items():
+            print(f"    {count} x {error_type}")
+    print("-" * len(header))
+    print(f"{report['journeys']} journeys completed, {report['failed_journeys']} failed "
+          f"({report['error_rate'] * 100:.1f}%) in {report['elapsed_s']:.0f}s")
+    print(f"throughput: {report['journeys_per_s']:.2f} journeys/s, {report['steps_per_s']:.2f} steps/s")
+    if report["journey_p50_ms"] is not None:
+        print(f"journey time: p50 {report['journey_p50_ms']:.0f} ms, p95 {report['journey_p95_ms']:.0f} ms")
+    if report["step_retries"]:
+        print(f"step retries: {report['step_retries']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load test the storefront with page-object journeys")
+    parser.add_argument("--journey", choices=sorted(JOURNEYS), default="checkout")
+    parser.add_argument("--users", type=int, default=5, help="users to ramp up to")
+    parser.add_argument("--ramp-up", type=float, default=10, help="seconds to reach --users")
+    parser.add_argument("--duration", type=float, default=60, help="seconds to hold --users")
+    parser.add_argument("--stages", nargs="+", type=parse_stage, metavar="SECONDS:USERS",
+                        help="ramp profile, replaces --users/--ramp-up/--duration")
+    parser.add_argument("--think-time", type=float, default=0, help="pause between a user's journeys")
+    parser.add_argument("--profile", default="fast", help="browser launch profile (fast is headless)")
+    parser.add_argument("--local", action="store_true", help="serve the bundled storefront and test it")
+    args = parser.parse_args()
+    
+    stages = args.stages or [(args.ramp_up, args.users), (args.duration, args.users)]
+    
+    storefront = None
+    if args.local or config.use_local_storefront:
+        from storefront import StorefrontServer
+        storefront = StorefrontServer(config.storefront_host, config.storefront_port).start()
+        config.override('settings', 'base_url', storefront.url)
+    
+    print(f"{args.journey} journey against {config.base_url}, stages {stages}")
+    try:
+        report = run_load(args.journey, stages, args.think_time, args.profile)
+    finally:
+        if storefront is not None:
+            storefront.stop()
+    print_report(report)
+    
+    os.makedirs(REPORTS_DIR, exist_ok=True)
+    output_path = os.path.join(REPORTS_DIR, "load_test.json")
+    with open(output_path, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"\nResults written to {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+test_hot_paths.py - Benchmarks for the framework's hot paths
+Run against the local storefront with pytest-benchmark:
+    
+    pytest benchmarks/ --benchmark-only --benchmark-save=baseline
+    pytest benchmarks/ --benchmark-only --benchmark-compare --benchmark-compare-fail=median:15%
+
+Changes to the page objects or WaitHelper should come with a comparison run
+"""
+
+import pytest
+from selenium.webdriver.common.by import By
+from utils.config_reader import config
+from utils.driver_factory import create_driver
+from utils.fixture_driver import launch_driver
+from utils.hang_watchdog import hang_watchdog
+from utils.network_interceptor import NetworkInterceptor
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+
+# Browser launches are slow - fewer rounds keep the suite short
+DRIVER_ROUNDS = 5
+FLOW_ROUNDS = 10
+
+CART_PRODUCTS = ["sauce-labs-backpack", "sauce-labs-bike-light", "sauce-labs-bolt-t-shirt"]
+
+
+@pytest.mark.benchmark(group="driver")
+class TestDriverLifecycle:
+    """
+    Cost of the driver fixture per test
+    Browsers come from utils/fixture_driver.py like in tests/conftest.py, so the
+    numbers include command timing, the hang watchdog and network interception
+    """
+    
+    def test_raw_launch(self, benchmark):
+        """Raw launch only: create_driver(), open the base URL and quit - no instrumentation"""
+        def raw():
+            driver = create_driver()
+            driver.get(config.base_url)
+            driver.quit()
+        
+        benchmark.pedantic(raw, rounds=DRIVER_ROUNDS, warmup_rounds=1)
+    
+    def test_isolated_driver(self, benchmark):
+        """Launch an instrumented browser, open the base URL and quit (isolated mode without pre-spawning)"""
+        def isolated():
+            driver = launch_driver()
+            driver.get(config.base_url)
+            _fixture_test(driver)
+            driver.quit()
+        
+        benchmark.pedantic(isolated, rounds=DRIVER_ROUNDS, warmup_rounds=1)
+    
+    def test_prespawned_driver(self, benchmark, browser_prespawner):
+        """Take a pre-spawned browser and retire it (isolated mode, back-to-back tests)"""
+        def prespawned():
+            driver = browser_prespawner.take()
+            _fixture_test(driver)
+            browser_prespawner.retire(driver)
+        
+        benchmark.pedantic(prespawned, rounds=DRIVER_ROUNDS, warmup_rounds=1)
+    
+    def test_pooled_driver(self, benchmark, driver_pool):
+        """Acquire and release a pooled browser (pooled mode, includes the reset)"""
+        def pooled():
+            driver = driver_pool.acquire()
+            _fixture_test(driver)
+            driver_pool.release(driver)
+        
+        benchmark.pedantic(pooled, rounds=FLOW_ROUNDS, warmup_rounds=1)
+
+
+def _fixture_test(driver):
+    """The per-test bookkeeping the driver fixture does around an (empty) test"""
+    interceptor = NetworkInterceptor.for_driver(driver)
+    interceptor.begin_test()
+    hang_watchdog.watch_test("benchmark", driver)
+    hang_watchdog.end_test()
+    interceptor.collect()
+
+
+@pytest.mark.benchmark(group="login")
+class TestLogin:
+    """Login through the form and through the session cookie"""
+    
+    def test_login_form(self, benchmark, driver):
+        """LoginPage.login up to the products page being displayed"""
+        def open_login():
+            driver.delete_all_cookies()
+            LoginPage(driver).open()
+        
+        def login():
+            products_page = LoginPage(driver).login(config.valid_username, config.valid_password)
+            assert products_page.is_products_page_displayed()
+        
+        benchmark.pedantic(login, setup=open_login, rounds=FLOW_ROUNDS)
+    
+    def test_login_with_session(self, benchmark, driver):
+        """LoginPage.login_with_session up to the products page being displayed"""
+        def login():
+            products_page = LoginPage(driver).login_with_session(config.valid_username)
+            assert products_page.is_products_page_displayed()
+        
+        benchmark.pedantic(login, setup=driver.delete_all_cookies, rounds=FLOW_ROUNDS)
+
+
+@pytest.mark.benchmark(group="base-page")
+class TestBasePage:
+    """Single element interactions every page object builds on"""
+    
+    def test_click(self, benchmark, login_page):
+        """BasePage.click on a visible input"""
+        benchmark(login_page.click, LoginPage.USERNAME_INPUT)
+    
+    def test_type_text(self, benchmark, login_page):
+        """BasePage.type_text (clear + send_keys)"""
+        benchmark(login_page.type_text, LoginPage.USERNAME_INPUT, config.valid_username)
+    
+    def test_get_text(self, benchmark, login_page):
+        """BasePage.get_text on the products page title"""
+        products_page = login_page.login_with_session(config.valid_username)
+        result = benchmark(products_page.get_text, ProductsPage.PAGE_TITLE)
+        assert result == "Products"
+    
+    def test_is_element_absent(self, benchmark, login_page):
+        """Negative check - should return without waiting"""
+        result = benchmark(login_page.is_element_absent, (By.ID, "not-on-this-page"))
+        assert result
+    
+    def test_wait_for_element_count(self, benchmark, login_page):
+        """WaitHelper.wait_for_element_count on a condition that already holds"""
+        products_page = login_page.login_with_session(config.valid_username)
+        result = benchmark(products_page.wait.wait_for_element_count, ProductsPage.PRODUCT_ITEMS, 6)
+        assert result
+
+
+@pytest.mark.benchmark(group="page-objects")
+class TestPageObjects:
+    """Page-object methods used by most tests"""
+    
+    def test_get_all_product_names(self, benchmark, login_page):
+        """ProductsPage.get_all_product_names on the full inventory"""
+        products_page = login_page.login_with_session(config.valid_username)
+        names = benchmark(products_page.get_all_product_names)
+        assert len(names) == 6
+    
+    def test_remove_all_items(self, benchmark, login_page):
+        """CartPage.remove_all_items with three items in the cart"""
+        products_page = login_page.login_with_session(config.valid_username)
+        cart_page = CartPage(login_page.driver)
+        
+        def seed():
+            products_page.seed_cart(CART_PRODUCTS, landing_path="cart.html")
+        
+        benchmark.pedantic(cart_page.remove_all_items, setup=seed, rounds=FLOW_ROUNDS)
+        assert cart_page.is_cart_empty()
+    
+    def test_checkout_flow(self, benchmark, login_page):
+        """Cart -> information -> overview -> complete"""
+        products_page = login_page.login_with_session(config.valid_username)
+        
+        def seed():
+            products_page.seed_cart(["sauce-labs-backpack"], landing_path="cart.html")
+        
+        def checkout():
+            checkout_page = CartPage(login_page.driver).proceed_to_checkout()
+            checkout_page.proceed_to_overview("Shivansh", "Bajpai", "208001")
+            assert checkout_page.click_finish().is_order_successful()
+        
+        benchmark.pedantic(checkout, setup=seed, rounds=FLOW_ROUNDS)
@@ -1,11 +1,29 @@
 """
 Pages package - Contains all Page Object classes
+Classes are imported on first access, so importing one page object
+does not load all of them
 """
 
-from pages.base_page import BasePage
-from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
-from pages.cart_page import CartPage
-from pages.checkout_page import CheckoutPage
+import importlib
 
-__all__ = ['BasePage', 'LoginPage', 'ProductsPage', 'CartPage', 'CheckoutPage']
+_MODULES = {
+    'BasePage': 'pages.base_page',
+    'LoginPage': 'pages.login_page',
+    'ProductsPage': 'pages.products_page',
+    'CartPage': 'pages.cart_page',
+    'CheckoutPage': 'pages.checkout_page',
+}
+
+__all__ = list(_MODULES)
+
+
+def import_all() -> None:
+    """Import every page module, e.g. before walking BasePage subclasses"""
+    for module in set(_MODULES.values()):
+        importlib.import_module(module)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name]), name)
+    raise AttributeError(f"module 'pages' has no attribute '{name}'")
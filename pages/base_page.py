@@ -5,42 +5,126 @@ Contains common methods used across all pages
 
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from typing import Tuple, List
+from selenium.common.exceptions import TimeoutException
+from typing import Dict, Tuple, List, Optional, Sequence
 from utils.wait_helper import WaitHelper
+from utils.config_reader import config
+from utils.dom_scripts import CLICK_ALL_JS, READ_ELEMENTS_JS, locator_args
+from utils.step_retry import step_retry
+from pages import import_all
 
 
 class BasePage:
     """Base class for all page objects"""
     
+    # URL patterns this page needs even if they match the network blocklist
+    REQUIRED_RESOURCES: List[str] = []
+    
+    # click_all reads the outcome once the DOM has been quiet this long (ms),
+    # waiting at most CLICK_SETTLE_TIMEOUT for batched re-renders
+    CLICK_SETTLE_QUIET = 50
+    CLICK_SETTLE_TIMEOUT = 2000
+    
     def __init__(self, driver: WebDriver):
         self.driver = driver
         self.wait = WaitHelper(driver)
     
+    @classmethod
+    def all_required_resources(cls) -> List[str]:
+        """
+        REQUIRED_RESOURCES declared by this class and every page object below it
+        Page modules load lazily, so all of them are imported first - otherwise a page
+        first used after the browser started would have its resources blocked
+        """
+        import_all()
+        resources = list(cls.REQUIRED_RESOURCES)
+        for subclass in cls.__subclasses__():
+            resources += subclass.all_required_resources()
+        return resources
+    
+    def open(self, path: str = "") -> None:
+        """Navigate directly to a path under the base URL"""
+        self.driver.get(f"{config.base_url.rstrip('/')}/{path.lstrip('/')}")
+    
     def click(self, locator: Tuple[str, str]) -> None:
         """Click on element after waiting for it to be clickable"""
-        self.wait.wait_for_element_clickable(locator).click()
+        step_retry.run(lambda: self.wait.wait_for_element_clickable(locator).click(), locator)
+    
+    def click_first(self, locator: Tuple[str, str]) -> None:
+        """Click the first element matching the locator, if there is one"""
+        def click_first_match():
+            elements = self.get_elements(locator)
+            if elements:
+                elements[0].click()
+        
+        step_retry.run(click_first_match, locator)
+    
+    def click_all(self, locators: List[Tuple[str, str]], limit: Optional[int] = None,
+                  read_before: Optional[Tuple[str, str]] = None) -> Dict[str, List[str]]:
+        """
+        Bulk click - click every element matching the locators (up to `limit`)
+        in a single in-page script instead of one round trip per click
+        The outcome is read after the page settles, so batched re-renders are counted
+        Returns {"changed": [ids of the clicks that took effect],
+                 "texts": [texts of read_before matches, read first]}
+        A click that left the page unchanged (disabled or broken button) is not in "changed"
+        """
+        return self.driver.execute_async_script(
+            CLICK_ALL_JS,
+            locator_args(locators),
+            limit,
+            list(read_before) if read_before else None,
+            self.CLICK_SETTLE_QUIET,
+            self.CLICK_SETTLE_TIMEOUT
+        )
     
     def type_text(self, locator: Tuple[str, str], text: str) -> None:
         """Clear field and type text"""
-        element = self.wait.wait_for_element_visible(locator)
-        element.clear()
-        element.send_keys(text)
+        def clear_and_type():
+            element = self.wait.wait_for_element_visible(locator)
+            element.clear()
+            element.send_keys(text)
+        
+        step_retry.run(clear_and_type, locator)
     
     def get_text(self, locator: Tuple[str, str]) -> str:
         """Get text from element"""
-        return self.wait.wait_for_element_visible(locator).text
+        return step_retry.run(lambda: self.wait.wait_for_element_visible(locator).text, locator)
     
-    def is_displayed(self, locator: Tuple[str, str]) -> bool:
-        """Check if element is displayed"""
-        try:
-            return self.wait.wait_for_element_visible(locator).is_displayed()
-        except:
-            return False
+    def is_displayed(self, locator: Tuple[str, str], timeout: Optional[float] = None) -> bool:
+        """
+        Check if element is displayed, waiting up to `timeout` seconds
+        (the short negative_wait by default) without stacking the implicit wait on top
+        """
+        if timeout is None:
+            timeout = config.negative_wait
+        return self.wait.is_element_visible_within(locator, timeout)
     
     def get_elements(self, locator: Tuple[str, str]) -> List[WebElement]:
         """Get list of elements"""
         return self.driver.find_elements(*locator)
     
+    def read_elements(self, locators: Dict[str, Tuple[str, str]],
+                      attributes: Sequence[str] = ()) -> Dict[str, List[Dict[str, str]]]:
+        """
+        Bulk read - text and attributes of every element matching each locator,
+        fetched in a single execute_script round trip
+        Returns {key: [{"text": ..., <attribute>: ...}, ...]} keyed like `locators`
+        """
+        keys = list(locators)
+        results = self.driver.execute_script(
+            READ_ELEMENTS_JS, locator_args([locators[key] for key in keys]), list(attributes)
+        )
+        return dict(zip(keys, results))
+    
+    def get_texts(self, locator: Tuple[str, str]) -> List[str]:
+        """Get the text of every matching element in one round trip"""
+        records = self.read_elements({"items": locator})["items"]
+        # Nothing rendered yet - give the implicit wait a chance, as find_elements would
+        if not records and self.driver.find_elements(*locator):
+            records = self.read_elements({"items": locator})["items"]
+        return [record["text"] for record in records]
+    
     def get_current_url(self) -> str:
         """Get current page URL"""
         return self.driver.current_url
@@ -50,6 +134,20 @@ class BasePage:
         return self.driver.title
     
     def is_element_present(self, locator: Tuple[str, str]) -> bool:
-        """Check if element exists in DOM"""
+        """
+        Positive check - element exists in DOM, allowing the implicit wait for it to appear
+        A missing element costs the full implicit wait; use is_element_absent or
+        is_displayed when the element is expected to be missing
+        """
         elements = self.driver.find_elements(*locator)
         return len(elements) > 0
+    
+    def is_element_absent(self, locator: Tuple[str, str], timeout: Optional[float] = None) -> bool:
+        """
+        Negative check - True once no element matches the locator
+        Waits at most `timeout` seconds (negative_wait by default), never the implicit wait
+        """
+        try:
+            return self.wait.wait_for_element_absent(locator, timeout)
+        except TimeoutException:
+            return False
@@ -36,15 +36,12 @@ class CartPage(BasePage):
         return len(self.get_elements(self.CART_ITEMS))
     
     def get_cart_item_names(self) -> List[str]:
-        """Get names of all items in cart"""
-        names = self.get_elements(self.CART_ITEM_NAMES)
-        return [name.text for name in names]
+        """Get names of all items in cart (single round trip)"""
+        return self.get_texts(self.CART_ITEM_NAMES)
     
     def remove_first_item(self) -> None:
         """Remove the first item from cart"""
-        buttons = self.get_elements(self.REMOVE_BUTTONS)
-        if buttons:
-            buttons[0].click()
+        self.click_first(self.REMOVE_BUTTONS)
     
     def remove_item_by_name(self, product_name: str) -> None:
         """Remove specific item from cart by name"""
@@ -53,10 +50,28 @@ class CartPage(BasePage):
     
     def remove_all_items(self) -> None:
         """Remove all items from cart"""
-        buttons = self.get_elements(self.REMOVE_BUTTONS)
-        while buttons:
-            buttons[0].click()
-            buttons = self.get_elements(self.REMOVE_BUTTONS)
+        self.clear_cart()
+    
+    # =============== BULK CART OPERATIONS ===============
+    
+    def remove_products(self, product_names: List[str]) -> List[str]:
+        """
+        Remove several items in one batched click script, then wait once for the item count
+        Returns the slugs of the items that were actually removed
+        """
+        locators = [(By.ID, f"remove-{name.lower().replace(' ', '-')}") for name in product_names]
+        return self._bulk_remove(locators)
+    
+    def clear_cart(self) -> List[str]:
+        """Remove every item in one batched click script; returns removed slugs"""
+        return self._bulk_remove([self.REMOVE_BUTTONS])
+    
+    def _bulk_remove(self, locators: List) -> List[str]:
+        """Click remove buttons in one script and confirm the remaining item count"""
+        result = self.click_all(locators, read_before=self.CART_ITEMS)
+        remaining = len(result["texts"]) - len(result["changed"])
+        self.wait.wait_for_element_count(self.CART_ITEMS, remaining)
+        return [button_id[len("remove-"):] for button_id in result["changed"]]
     
     def continue_shopping(self):
         """Click Continue Shopping button"""
@@ -77,8 +92,8 @@ class CartPage(BasePage):
         return "cart" in self.get_current_url() and self.get_page_title_text() == "Your Cart"
     
     def is_cart_empty(self) -> bool:
-        """Check if cart is empty"""
-        return self.get_cart_item_count() == 0
+        """Check if cart is empty (fast negative check)"""
+        return self.is_element_absent(self.CART_ITEMS)
     
     def is_product_in_cart(self, product_name: str) -> bool:
         """Check if specific product is in cart"""
@@ -6,6 +6,8 @@ URL: https://www.saucedemo.com
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from pages.base_page import BasePage
+from utils.config_reader import config
+from typing import Dict, Optional
 
 
 class LoginPage(BasePage):
@@ -18,6 +20,10 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = (By.CSS_SELECTOR, "[data-test='error']")
     LOGIN_LOGO = (By.CLASS_NAME, "login_logo")
     
+    # =============== SESSION STATE ===============
+    SESSION_COOKIE = "session-username"
+    INVENTORY_PATH = "inventory.html"
+    
     def __init__(self, driver: WebDriver):
         super().__init__(driver)
     
@@ -48,6 +54,28 @@ class LoginPage(BasePage):
         from pages.products_page import ProductsPage
         return ProductsPage(self.driver)
     
+    def login_with_session(self, username: str, storage: Optional[Dict[str, str]] = None):
+        """
+        Fast login without the UI form - sets the session cookie and
+        optional localStorage entries, then deep-links to the inventory
+        Returns ProductsPage
+        """
+        # Cookies and storage can only be written for the loaded origin
+        if not self.get_current_url().startswith(config.base_url):
+            self.open()
+        
+        self.driver.add_cookie({"name": self.SESSION_COOKIE, "value": username, "path": "/"})
+        if storage:
+            self.driver.execute_script(
+                "for (const [key, value] of Object.entries(arguments[0])) {"
+                " window.localStorage.setItem(key, value); }",
+                storage
+            )
+        self.open(self.INVENTORY_PATH)
+        
+        from pages.products_page import ProductsPage
+        return ProductsPage(self.driver)
+    
     def login_expecting_failure(self, username: str, password: str) -> 'LoginPage':
         """Login expecting failure (for negative tests)"""
         self.enter_username(username)
@@ -58,8 +86,9 @@ class LoginPage(BasePage):
     # =============== VERIFICATIONS ===============
     
     def is_login_page_displayed(self) -> bool:
-        """Check if login page is displayed"""
-        return self.is_displayed(self.LOGIN_LOGO) and self.is_displayed(self.LOGIN_BUTTON)
+        """Check if login page is displayed (waits for the page to load, e.g. after logout)"""
+        timeout = self.wait.timeout
+        return self.is_displayed(self.LOGIN_LOGO, timeout) and self.is_displayed(self.LOGIN_BUTTON, timeout)
     
     def is_error_message_displayed(self) -> bool:
         """Check if error message is displayed"""
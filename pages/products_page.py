@@ -7,7 +7,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import Select
 from pages.base_page import BasePage
-from typing import List
+from typing import Dict, List, Optional
+import json
 
 
 class ProductsPage(BasePage):
@@ -26,6 +27,17 @@ class ProductsPage(BasePage):
     BURGER_MENU_BUTTON = (By.ID, "react-burger-menu-btn")
     LOGOUT_LINK = (By.ID, "logout_sidebar_link")
     
+    # =============== CLIENT-SIDE CART STATE ===============
+    CART_STORAGE_KEY = "cart-contents"
+    PRODUCT_IDS = {
+        "sauce-labs-bike-light": 0,
+        "sauce-labs-bolt-t-shirt": 1,
+        "sauce-labs-onesie": 2,
+        "test.allthethings()-t-shirt-(red)": 3,
+        "sauce-labs-backpack": 4,
+        "sauce-labs-fleece-jacket": 5,
+    }
+    
     def __init__(self, driver: WebDriver):
         super().__init__(driver)
     
@@ -41,9 +53,7 @@ class ProductsPage(BasePage):
     
     def add_first_product_to_cart(self) -> None:
         """Add the first product to cart"""
-        buttons = self.get_elements(self.ADD_TO_CART_BUTTONS)
-        if buttons:
-            buttons[0].click()
+        self.click_first(self.ADD_TO_CART_BUTTONS)
     
     def add_product_to_cart_by_name(self, product_name: str) -> None:
         """Add product to cart by its name"""
@@ -56,11 +66,78 @@ class ProductsPage(BasePage):
         self.click((By.ID, button_id))
     
     def add_multiple_products_to_cart(self, count: int) -> None:
-        """Add specified number of products to cart"""
-        for i in range(count):
-            buttons = self.get_elements(self.ADD_TO_CART_BUTTONS)
-            if i < len(buttons):
-                buttons[0].click()  # Always click first available button
+        """Add specified number of products to cart (first available buttons)"""
+        self._bulk_cart_update([self.ADD_TO_CART_BUTTONS], limit=count)
+    
+    # =============== BULK CART OPERATIONS ===============
+    
+    def add_products(self, product_names: List[str]) -> List[str]:
+        """
+        Add several products in one batched click script, then wait once for the badge
+        Returns the slugs of the products that were actually added
+        """
+        locators = [(By.ID, f"add-to-cart-{self._slug(name)}") for name in product_names]
+        return self._bulk_cart_update(locators)
+    
+    def remove_products(self, product_names: List[str]) -> List[str]:
+        """Remove several products in one batched click script; returns removed slugs"""
+        locators = [(By.ID, f"remove-{self._slug(name)}") for name in product_names]
+        return self._bulk_cart_update(locators)
+    
+    def clear_cart(self) -> List[str]:
+        """Remove every product in the cart from the products page; returns removed slugs"""
+        return self._bulk_cart_update([self.REMOVE_BUTTONS])
+    
+    def _bulk_cart_update(self, locators: List, limit: Optional[int] = None) -> List[str]:
+        """Click all add/remove buttons in one script and confirm the final badge count"""
+        result = self.click_all(locators, limit=limit, read_before=self.CART_BADGE)
+        badge = result["texts"]
+        count = int(badge[0]) if badge else 0
+        
+        changed = []
+        for button_id in result["changed"]:
+            if button_id.startswith("add-to-cart-"):
+                count += 1
+                changed.append(button_id[len("add-to-cart-"):])
+            else:
+                count -= 1
+                changed.append(button_id[len("remove-"):])
+        
+        if count > 0:
+            self.wait.wait_for_text_to_be(self.CART_BADGE, str(count))
+        else:
+            self.wait.wait_for_element_absent(self.CART_BADGE, self.wait.timeout)
+        return changed
+    
+    @staticmethod
+    def _slug(product_name: str) -> str:
+        return product_name.lower().replace(' ', '-')
+    
+    @classmethod
+    def cart_storage(cls, product_names: List[str]) -> Dict[str, str]:
+        """
+        Build the localStorage entry holding the given cart contents
+        Product names accept the display name or the button slug
+        """
+        product_ids = []
+        for product_name in product_names:
+            slug = product_name.lower().replace(' ', '-')
+            if slug not in cls.PRODUCT_IDS:
+                raise ValueError(f"Unknown product '{product_name}'")
+            product_ids.append(cls.PRODUCT_IDS[slug])
+        return {cls.CART_STORAGE_KEY: json.dumps(product_ids)}
+    
+    def seed_cart(self, product_names: List[str], landing_path: Optional[str] = None) -> None:
+        """
+        Replace cart contents directly in client-side state (one script call),
+        then reload the current page or navigate to landing_path
+        """
+        (key, value), = self.cart_storage(product_names).items()
+        self.driver.execute_script("window.localStorage.setItem(arguments[0], arguments[1]);", key, value)
+        if landing_path is None:
+            self.driver.refresh()
+        else:
+            self.open(landing_path)
     
     def go_to_cart(self):
         """Navigate to cart page"""
@@ -103,32 +180,44 @@ class ProductsPage(BasePage):
         return "inventory" in self.get_current_url() and self.get_page_title_text() == "Products"
     
     def get_cart_badge_count(self) -> int:
-        """Get the number shown on cart badge"""
+        """Get the number shown on cart badge (0 when there is none)"""
+        if not self.is_cart_badge_displayed():
+            return 0
         try:
             return int(self.get_text(self.CART_BADGE))
         except:
             return 0
     
     def is_cart_badge_displayed(self) -> bool:
-        """Check if cart badge is displayed"""
-        return self.is_element_present(self.CART_BADGE)
+        """Check if cart badge is displayed, giving up after negative_wait"""
+        return self.is_displayed(self.CART_BADGE)
+    
+    def is_cart_badge_absent(self) -> bool:
+        """Check that no cart badge is shown (fast negative check)"""
+        return self.is_element_absent(self.CART_BADGE)
     
     def get_first_product_name(self) -> str:
         """Get the name of the first product"""
-        names = self.get_elements(self.PRODUCT_NAMES)
-        return names[0].text if names else ""
+        names = self.get_all_product_names()
+        return names[0] if names else ""
     
     def get_first_product_price(self) -> str:
         """Get the price of the first product"""
-        prices = self.get_elements(self.PRODUCT_PRICES)
-        return prices[0].text if prices else ""
+        prices = self.get_all_product_prices()
+        return prices[0] if prices else ""
     
     def get_all_product_names(self) -> List[str]:
-        """Get all product names"""
-        names = self.get_elements(self.PRODUCT_NAMES)
-        return [name.text for name in names]
+        """Get all product names (single round trip)"""
+        return self.get_texts(self.PRODUCT_NAMES)
     
     def get_all_product_prices(self) -> List[str]:
-        """Get all product prices"""
-        prices = self.get_elements(self.PRODUCT_PRICES)
-        return [price.text for price in prices]
+        """Get all product prices (single round trip)"""
+        return self.get_texts(self.PRODUCT_PRICES)
+    
+    def get_product_catalog(self) -> List[Dict[str, str]]:
+        """Get name and price of every product in display order (single round trip)"""
+        data = self.read_elements({"names": self.PRODUCT_NAMES, "prices": self.PRODUCT_PRICES})
+        return [
+            {"name": name["text"], "price": price["text"]}
+            for name, price in zip(data["names"], data["prices"])
+        ]
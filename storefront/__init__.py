@@ -0,0 +1,7 @@
+"""
+Storefront package - Local offline stand-in for the application under test
+"""
+
+from storefront.server import StorefrontServer
+
+__all__ = ['StorefrontServer']
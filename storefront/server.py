@@ -0,0 +1,85 @@
+"""
+server.py - Serves the bundled storefront from a background thread
+Reproduces the saucedemo.com pages, element IDs and special users used by pages/*.py
+
+Run standalone:  python -m storefront.server --port 8000
+"""
+
+import argparse
+import functools
+import os
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+
+
+class _StorefrontRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler that stays quiet during test runs"""
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StorefrontServer:
+    """Local HTTP server for the storefront, started and stopped around a test session"""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        if self._httpd is None:
+            raise RuntimeError("Storefront server is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'StorefrontServer':
+        """Bind the port (0 picks a free one) and serve in a daemon thread"""
+        handler = functools.partial(_StorefrontRequestHandler, directory=STATIC_DIR)
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="storefront-server", daemon=True
+        )
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        """Shut the server down and release the port"""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+    
+    def __enter__(self) -> 'StorefrontServer':
+        return self.start()
+    
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the local storefront")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    
+    server = StorefrontServer(args.host, args.port).start()
+    print(f"Storefront running at {server.url} (Ctrl+C to stop)")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
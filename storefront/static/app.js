@@ -0,0 +1,463 @@
+/*
+ * app.js - Client side of the local storefront
+ * Mirrors the markup, session cookie and cart storage of saucedemo.com
+ * so the page objects in pages/*.py work unchanged
+ */
+
+(function () {
+  "use strict";
+
+  var SESSION_COOKIE = "session-username";
+  var CART_STORAGE_KEY = "cart-contents";
+  var LOGIN_ERROR_KEY = "login-error";
+  var PASSWORD = "secret_sauce";
+  var TAX_RATE = 0.08;
+  var GLITCH_DELAY_MS = 3000;
+
+  var USERS = [
+    "standard_user",
+    "locked_out_user",
+    "problem_user",
+    "performance_glitch_user",
+    "error_user",
+    "visual_user"
+  ];
+
+  var CATALOG = [
+    { id: 0, name: "Sauce Labs Bike Light", price: 9.99,
+      desc: "A red light that keeps you visible on night rides. Water-resistant, with three lighting modes." },
+    { id: 1, name: "Sauce Labs Bolt T-Shirt", price: 15.99,
+      desc: "Soft cotton tee with the bolt logo, cut for everyday comfort." },
+    { id: 2, name: "Sauce Labs Onesie", price: 7.99,
+      desc: "Snap-bottom onesie for the youngest testers. Machine washable." },
+    { id: 3, name: "Test.allTheThings() T-Shirt (Red)", price: 15.99,
+      desc: "Classic red crew neck for anyone who believes every path deserves a test." },
+    { id: 4, name: "Sauce Labs Backpack", price: 29.99,
+      desc: "Sleek, water-resistant backpack with a padded laptop sleeve and plenty of pockets." },
+    { id: 5, name: "Sauce Labs Fleece Jacket", price: 49.99,
+      desc: "Mid-weight quarter-zip fleece that works on its own or as a layer." }
+  ];
+
+  var SORTS = {
+    az: function (a, b) { return a.name.localeCompare(b.name); },
+    za: function (a, b) { return b.name.localeCompare(a.name); },
+    lohi: function (a, b) { return a.price - b.price || a.name.localeCompare(b.name); },
+    hilo: function (a, b) { return b.price - a.price || a.name.localeCompare(b.name); }
+  };
+
+  // =============== HELPERS ===============
+
+  function $(selector, root) { return (root || document).querySelector(selector); }
+
+  function escapeHtml(text) {
+    return String(text).replace(/[&<>"']/g, function (ch) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[ch];
+    });
+  }
+
+  function slug(product) { return product.name.toLowerCase().replace(/ /g, "-"); }
+
+  function money(value) { return "$" + value.toFixed(2); }
+
+  function findProduct(id) {
+    for (var i = 0; i < CATALOG.length; i++) {
+      if (CATALOG[i].id === id) { return CATALOG[i]; }
+    }
+    return null;
+  }
+
+  function go(path) { window.location.href = "/" + path; }
+
+  // =============== SESSION ===============
+
+  function currentUser() {
+    var cookies = document.cookie ? document.cookie.split("; ") : [];
+    for (var i = 0; i < cookies.length; i++) {
+      var parts = cookies[i].split("=");
+      if (parts[0] === SESSION_COOKIE) { return decodeURIComponent(parts.slice(1).join("=")); }
+    }
+    return null;
+  }
+
+  function startSession(username) {
+    document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+  }
+
+  function endSession() {
+    document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+  }
+
+  function requireSession() {
+    var user = currentUser();
+    if (!user) {
+      window.sessionStorage.setItem(LOGIN_ERROR_KEY,
+        "Epic sadface: You can only access '" + window.location.pathname + "' when you are logged in.");
+      go("");
+    }
+    return user;
+  }
+
+  // =============== CART ===============
+
+  function getCart() {
+    try {
+      var ids = JSON.parse(window.localStorage.getItem(CART_STORAGE_KEY) || "[]");
+      return Array.isArray(ids) ? ids : [];
+    } catch (e) {
+      return [];
+    }
+  }
+
+  function setCart(ids) { window.localStorage.setItem(CART_STORAGE_KEY, JSON.stringify(ids)); }
+
+  function addToCart(id) {
+    var ids = getCart();
+    if (ids.indexOf(id) === -1) { ids.push(id); }
+    setCart(ids);
+  }
+
+  function removeFromCart(id) {
+    setCart(getCart().filter(function (itemId) { return itemId !== id; }));
+  }
+
+  function cartProducts() {
+    return getCart().map(findProduct).filter(function (product) { return product !== null; });
+  }
+
+  // =============== SHARED LAYOUT ===============
+
+  function renderHeader(title, user) {
+    var header = $("#header_container");
+    header.innerHTML =
+      '<div class="primary_header">' +
+      '  <div id="menu_button_container">' +
+      '    <button type="button" id="react-burger-menu-btn">Open Menu</button>' +
+      '    <div class="bm-menu-wrap" aria-hidden="true">' +
+      '      <nav class="bm-item-list">' +
+      '        <a id="inventory_sidebar_link" class="bm-item menu-item" href="/inventory.html">All Items</a>' +
+      '        <a id="about_sidebar_link" class="bm-item menu-item" href="#">About</a>' +
+      '        <a id="logout_sidebar_link" class="bm-item menu-item" href="#">Logout</a>' +
+      '        <a id="reset_sidebar_link" class="bm-item menu-item" href="#">Reset App State</a>' +
+      '      </nav>' +
+      '      <button type="button" id="react-burger-cross-btn">Close Menu</button>' +
+      '    </div>' +
+      '  </div>' +
+      '  <div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+      '  <div id="shopping_cart_container" class="shopping_cart_container' +
+      (user === "visual_user" ? " visual_failure" : "") + '">' +
+      '    <a class="shopping_cart_link" data-test="shopping-cart-link" href="/cart.html"></a>' +
+      '  </div>' +
+      '</div>' +
+      '<div class="header_secondary_container">' +
+      '  <span class="title" data-test="title">' + escapeHtml(title) + '</span>' +
+      '  <div class="header_secondary_slot"></div>' +
+      '</div>';
+
+    var menu = $(".bm-menu-wrap", header);
+    $("#react-burger-menu-btn", header).addEventListener("click", function () {
+      menu.classList.add("open");
+      menu.setAttribute("aria-hidden", "false");
+    });
+    $("#react-burger-cross-btn", header).addEventListener("click", function () {
+      menu.classList.remove("open");
+      menu.setAttribute("aria-hidden", "true");
+    });
+    $("#logout_sidebar_link", header).addEventListener("click", function (event) {
+      event.preventDefault();
+      endSession();
+      go("");
+    });
+    $("#reset_sidebar_link", header).addEventListener("click", function (event) {
+      event.preventDefault();
+      setCart([]);
+      refreshCartBadge();
+      if (document.body.getAttribute("data-page") === "inventory") { renderInventory(user); }
+    });
+
+    refreshCartBadge();
+  }
+
+  function refreshCartBadge() {
+    var link = $(".shopping_cart_link");
+    if (!link) { return; }
+    var count = getCart().length;
+    link.innerHTML = count > 0
+      ? '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + count + '</span>'
+      : "";
+  }
+
+  function cartButton(product, idPrefixOnly) {
+    var inCart = getCart().indexOf(product.id) !== -1;
+    var action = inCart ? "remove" : "add-to-cart";
+    var id = idPrefixOnly ? action : action + "-" + slug(product);
+    return '<button type="button" class="btn btn_small btn_inventory ' +
+      (inCart ? "btn_secondary" : "btn_primary") + '" id="' + escapeHtml(id) +
+      '" data-test="' + escapeHtml(id) + '" data-product-id="' + product.id + '">' +
+      (inCart ? "Remove" : "Add to cart") + '</button>';
+  }
+
+  function itemRow(product, extraClass, controls) {
+    return '<div class="' + extraClass + '" data-test="inventory-item">' +
+      controls.before +
+      '<div class="inventory_item_description">' +
+      '  <div class="inventory_item_label">' +
+      '    <a href="/inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+      '      <div class="inventory_item_name" data-test="inventory-item-name">' + escapeHtml(product.name) + '</div>' +
+      '    </a>' +
+      '    <div class="inventory_item_desc" data-test="inventory-item-desc">' + escapeHtml(product.desc) + '</div>' +
+      '  </div>' +
+      '  <div class="pricebar">' +
+      '    <div class="inventory_item_price" data-test="inventory-item-price">' + controls.price + '</div>' +
+      controls.after +
+      '  </div>' +
+      '</div>' +
+      '</div>';
+  }
+
+  // =============== LOGIN PAGE ===============
+
+  function showLoginError(message) {
+    var container = $(".error-message-container");
+    container.classList.add("error");
+    container.innerHTML = '<h3 data-test="error">' + escapeHtml(message) +
+      '<button type="button" class="error-button" data-test="error-button">&times;</button></h3>';
+    $("#user-name").classList.add("error");
+    $("#password").classList.add("error");
+    $(".error-button", container).addEventListener("click", clearLoginError);
+  }
+
+  function clearLoginError() {
+    var container = $(".error-message-container");
+    container.classList.remove("error");
+    container.innerHTML = "";
+    $("#user-name").classList.remove("error");
+    $("#password").classList.remove("error");
+  }
+
+  function initLogin() {
+    var pending = window.sessionStorage.getItem(LOGIN_ERROR_KEY);
+    if (pending) {
+      window.sessionStorage.removeItem(LOGIN_ERROR_KEY);
+      showLoginError(pending);
+    }
+
+    $("#login_credentials").innerHTML = "<h4>Accepted usernames are:</h4>" + USERS.join("<br>");
+
+    $("#login-form").addEventListener("submit", function (event) {
+      event.preventDefault();
+      var username = $("#user-name").value;
+      var password = $("#password").value;
+
+      if (!username) { return showLoginError("Epic sadface: Username is required"); }
+      if (!password) { return showLoginError("Epic sadface: Password is required"); }
+      if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+        return showLoginError("Epic sadface: Username and password do not match any user in this service");
+      }
+      if (username === "locked_out_user") {
+        return showLoginError("Epic sadface: Sorry, this user has been locked out.");
+      }
+
+      startSession(username);
+      var delay = username === "performance_glitch_user" ? GLITCH_DELAY_MS : 0;
+      window.setTimeout(function () { go("inventory.html"); }, delay);
+    });
+  }
+
+  // =============== INVENTORY PAGE ===============
+
+  function renderInventory(user) {
+    var sortKey = $(".product_sort_container").value;
+    var products = CATALOG.slice();
+    // problem_user: the sort dropdown has no effect
+    products.sort(SORTS[user === "problem_user" ? "az" : sortKey] || SORTS.az);
+
+    $(".inventory_list").innerHTML = products.map(function (product, index) {
+      // problem_user: every product image is broken
+      var image = user === "problem_user" ? "sl-404.svg" : "product.svg";
+      var price = product.price;
+      // visual_user: the first price on the grid is wrong
+      if (user === "visual_user" && index === 0) { price = price + 10; }
+      return itemRow(product, "inventory_item", {
+        before: '<div class="inventory_item_img"><a href="/inventory-item.html?id=' + product.id + '">' +
+          '<img alt="' + escapeHtml(product.name) +
+          '" src="/img/' + image + '"></a></div>',
+        price: money(price),
+        after: cartButton(product, false)
+      });
+    }).join("");
+  }
+
+  function bindCartButtons(container, user, onChange) {
+    container.addEventListener("click", function (event) {
+      var button = event.target.closest("button[data-product-id]");
+      if (!button) { return; }
+      var id = Number(button.getAttribute("data-product-id"));
+      var adding = button.id.indexOf("add-to-cart") === 0;
+
+      // problem_user / error_user: some buttons silently do nothing
+      if (user === "problem_user" && adding && id % 2 === 1) { return; }
+      if (user === "error_user" && !adding && id % 2 === 1) { return; }
+
+      if (adding) { addToCart(id); } else { removeFromCart(id); }
+      refreshCartBadge();
+      onChange();
+    });
+  }
+
+  function initInventory(user) {
+    renderHeader("Products", user);
+    var slot = $(".header_secondary_slot");
+    slot.innerHTML =
+      '<span class="select_container">' +
+      '  <span class="active_option" data-test="active-option">Name (A to Z)</span>' +
+      '  <select class="product_sort_container" data-test="product-sort-container">' +
+      '    <option value="az">Name (A to Z)</option>' +
+      '    <option value="za">Name (Z to A)</option>' +
+      '    <option value="lohi">Price (low to high)</option>' +
+      '    <option value="hilo">Price (high to low)</option>' +
+      '  </select>' +
+      '</span>';
+
+    var select = $(".product_sort_container");
+    select.addEventListener("change", function () {
+      $(".active_option").textContent = select.options[select.selectedIndex].text;
+      renderInventory(user);
+    });
+
+    var list = $(".inventory_list");
+    bindCartButtons(list, user, function () { renderInventory(user); });
+
+    var render = function () { renderInventory(user); };
+    if (user === "performance_glitch_user") { window.setTimeout(render, GLITCH_DELAY_MS); } else { render(); }
+  }
+
+  // =============== ITEM DETAIL PAGE ===============
+
+  function initInventoryItem(user) {
+    renderHeader("", user);
+    var match = /[?&]id=(\d+)/.exec(window.location.search);
+    var product = match ? findProduct(Number(match[1])) : null;
+    var container = $(".inventory_details_container");
+
+    var render = function () {
+      if (!product) {
+        container.innerHTML = '<div class="inventory_details_name">ITEM NOT FOUND</div>';
+        return;
+      }
+      container.innerHTML =
+        '<button type="button" id="back-to-products" class="btn btn_secondary back">Back to products</button>' +
+        '<div class="inventory_details">' +
+        '  <img class="inventory_details_img" alt="' + escapeHtml(product.name) + '" src="/img/product.svg">' +
+        '  <div class="inventory_details_desc_container">' +
+        '    <div class="inventory_details_name large_size">' + escapeHtml(product.name) + '</div>' +
+        '    <div class="inventory_details_desc large_size">' + escapeHtml(product.desc) + '</div>' +
+        '    <div class="inventory_details_price">' + money(product.price) + '</div>' +
+        cartButton(product, true) +
+        '  </div>' +
+        '</div>';
+      $("#back-to-products").addEventListener("click", function () { go("inventory.html"); });
+    };
+
+    bindCartButtons(container, user, render);
+    render();
+  }
+
+  // =============== CART PAGE ===============
+
+  function renderCartList(container, products, withControls) {
+    container.innerHTML =
+      '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+      products.map(function (product) {
+        return itemRow(product, "cart_item", {
+          before: '<div class="cart_quantity" data-test="item-quantity">1</div>',
+          price: money(product.price),
+          after: withControls ? cartButton(product, false) : ""
+        });
+      }).join("");
+  }
+
+  function initCart(user) {
+    renderHeader("Your Cart", user);
+    var list = $(".cart_list");
+    var render = function () { renderCartList(list, cartProducts(), true); };
+
+    bindCartButtons(list, user, render);
+    render();
+
+    $("#continue-shopping").addEventListener("click", function () { go("inventory.html"); });
+    $("#checkout").addEventListener("click", function () { go("checkout-step-one.html"); });
+  }
+
+  // =============== CHECKOUT PAGES ===============
+
+  function initCheckoutStepOne(user) {
+    renderHeader("Checkout: Your Information", user);
+    var fields = [
+      { id: "first-name", label: "First Name" },
+      { id: "last-name", label: "Last Name" },
+      { id: "postal-code", label: "Postal Code" }
+    ];
+
+    $("#checkout-info-form").addEventListener("submit", function (event) {
+      event.preventDefault();
+      var container = $(".error-message-container");
+      for (var i = 0; i < fields.length; i++) {
+        var input = $("#" + fields[i].id);
+        // problem_user: the last name field never keeps its value
+        if (user === "problem_user" && fields[i].id === "last-name") { input.value = ""; }
+        if (!input.value) {
+          container.classList.add("error");
+          container.innerHTML = '<h3 data-test="error">Error: ' + fields[i].label + ' is required' +
+            '<button type="button" class="error-button" data-test="error-button">&times;</button></h3>';
+          return;
+        }
+      }
+      go("checkout-step-two.html");
+    });
+    $("#cancel").addEventListener("click", function () { go("cart.html"); });
+  }
+
+  function initCheckoutStepTwo(user) {
+    renderHeader("Checkout: Overview", user);
+    var products = cartProducts();
+    renderCartList($(".cart_list"), products, false);
+
+    var subtotal = products.reduce(function (sum, product) { return sum + product.price; }, 0);
+    var tax = Math.round(subtotal * TAX_RATE * 100) / 100;
+    $(".summary_subtotal_label").textContent = "Item total: " + money(subtotal);
+    $(".summary_tax_label").textContent = "Tax: " + money(tax);
+    $(".summary_total_label").textContent = "Total: " + money(subtotal + tax);
+
+    $("#finish").addEventListener("click", function () {
+      // error_user: finishing the order fails silently
+      if (user === "error_user") { return; }
+      setCart([]);
+      go("checkout-complete.html");
+    });
+    $("#cancel").addEventListener("click", function () { go("inventory.html"); });
+  }
+
+  function initCheckoutComplete(user) {
+    renderHeader("Checkout: Complete!", user);
+    $("#back-to-products").addEventListener("click", function () { go("inventory.html"); });
+  }
+
+  // =============== BOOTSTRAP ===============
+
+  var PAGES = {
+    "login": initLogin,
+    "inventory": initInventory,
+    "inventory-item": initInventoryItem,
+    "cart": initCart,
+    "checkout-step-one": initCheckoutStepOne,
+    "checkout-step-two": initCheckoutStepTwo,
+    "checkout-complete": initCheckoutComplete
+  };
+
+  document.addEventListener("DOMContentLoaded", function () {
+    var page = document.body.getAttribute("data-page");
+    if (page === "login") { return initLogin(); }
+    var user = requireSession();
+    if (user) { PAGES[page](user); }
+  });
+})();
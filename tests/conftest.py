@@ -4,16 +4,6 @@ Contains setup/teardown fixtures for all tests
 """
 
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 import os
 import sys
 
@@ -21,85 +11,119 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.config_reader import config
+from utils.driver_factory import create_shared_browser
+from utils.fixture_driver import launch_driver, attach_session
+from utils.driver_pool import DriverPool
+from utils.browser_prespawner import BrowserPrespawner
+from utils.browser_contexts import BrowserContexts, SharedBrowser
+from utils.browser_supervisor import browser_supervisor, memory_report
+from utils.network_interceptor import NetworkInterceptor, resource_sizes, traffic_summary
+from utils.artifacts import artifact_writer, capture, worker_id
+from utils.command_timing import command_timer
+from utils.duration_history import duration_history
+from utils.hang_watchdog import hang_watchdog
+from utils.step_retry import step_retry
+from utils.flow_runner import flow_summary
 from pages.login_page import LoginPage
+from utils.wait_audit import wait_audit
+
+# Local storefront started by pytest_configure when enabled in config.ini
+_storefront = None
+
+# Browser hosting every test in driver_mode = contexts, owned by the controller (or a plain run)
+_shared_browser = None
+
+# Pre-spawner of this process once an isolated test asked for it
+_prespawner = None
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    Session-wide pool of reusable browsers
+    Each xdist worker runs its own session, so the pool is worker-local
+    """
+    pool = DriverPool(launch_driver)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def browser_prespawner():
+    """
+    Session-wide launcher for isolated mode - keeps fresh browsers ready
+    (worker-local under xdist, like the pool)
+    """
+    global _prespawner
+    prespawner = _prespawner = BrowserPrespawner(launch_driver).start()
+    yield prespawner
+    _prespawner = None
+    prespawner.close()
+
+
+@pytest.fixture(scope="session")
+def browser_contexts(request):
+    """
+    Session-wide attachment to the shared browser for contexts mode
+    (worker-local under xdist; the address comes from the controller)
+    """
+    address = getattr(request.config, "workerinput", {}).get("browser_address") or _shared_browser_address()
+    # Every new context is a new DevTools target - interception is enabled per target
+    contexts = BrowserContexts(
+        lambda: attach_session(address),
+        prepare=lambda driver: NetworkInterceptor.for_driver(driver).install()
+    )
+    yield contexts
+    contexts.close()
 
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request):
     """
-    Fixture to initialize and quit WebDriver
-    Runs before and after each test function
+    Fixture to provide a WebDriver for each test function
+    Pooled mode reuses a reset browser; isolated mode (config or
+    @pytest.mark.isolated) launches and quits a browser per test;
+    contexts mode opens a new browser context in one shared browser
     """
-    browser = config.browser
-    headless = config.headless
-    
-    if browser == "chrome":
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        
-        # ============ DISABLE PASSWORD BREACH ALERTS ============
-        options.add_argument("--disable-features=PasswordLeakDetection")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-        
-        # Disable password manager and save password prompts
-        prefs = {
-            "credentials_enable_service": False,
-            "profile.password_manager_enabled": False,
-            "profile.password_manager_leak_detection": False,
-            "profile.default_content_setting_values.notifications": 2
-        }
-        options.add_experimental_option("prefs", prefs)
-        # =========================================================
-        
-        # Fix for webdriver-manager issue - get correct executable path
-        driver_path = ChromeDriverManager().install()
-        # Ensure we get the actual chromedriver.exe, not THIRD_PARTY_NOTICES
-        if "THIRD_PARTY" in driver_path:
-            driver_path = driver_path.replace("THIRD_PARTY_NOTICES.chromedriver", "chromedriver.exe")
-        
-        service = ChromeService(executable_path=driver_path)
-        driver = webdriver.Chrome(service=service, options=options)
-    
-    elif browser == "firefox":
-        options = FirefoxOptions()
-        if headless:
-            options.add_argument("--headless")
-        driver = webdriver.Firefox(
-            service=FirefoxService(GeckoDriverManager().install()),
-            options=options
-        )
-        driver.maximize_window()
-    
-    elif browser == "edge":
-        options = EdgeOptions()
-        if headless:
-            options.add_argument("--headless")
-        driver = webdriver.Edge(
-            service=EdgeService(EdgeChromiumDriverManager().install()),
-            options=options
-        )
-        driver.maximize_window()
+    isolated = _needs_isolated_browser(request.node)
     
+    if isolated:
+        # A fresh browser, launched ahead of time and already on the base URL
+        prespawner = request.getfixturevalue("browser_prespawner")
+        driver = prespawner.take()
+    elif config.driver_mode == "contexts":
+        pool = request.getfixturevalue("browser_contexts")
+        driver = pool.acquire()
     else:
-        raise ValueError(f"Browser '{browser}' not supported!")
-    
-    # Set implicit wait
-    driver.implicitly_wait(config.implicit_wait)
+        pool = request.getfixturevalue("driver_pool")
+        driver = pool.acquire()
     
-    # Navigate to base URL
-    driver.get(config.base_url)
+    interceptor = NetworkInterceptor.for_driver(driver)
+    interceptor.begin_test()
+    hang_watchdog.watch_test(request.node.nodeid, driver)
     
     yield driver
     
-    # Teardown - quit browser
-    driver.quit()
+    hang_watchdog.end_test()
+    hang = hang_watchdog.killed_reason(driver)
+    if hang:
+        # The watchdog killed this browser (contexts mode: this worker's session) -
+        # drop it, the next test gets a fresh one
+        request.node.user_properties.append(("hang", hang))
+        if not isolated:
+            pool.forget(driver)
+        return
+    
+    # Traffic stats travel on the teardown report (xdist ships them to the controller)
+    request.node.user_properties.append(("network", interceptor.collect()))
+    
+    if isolated:
+        # Teardown - quit browser (in the background), noting its memory for the report
+        browser_supervisor.sample(driver)
+        prespawner.retire(driver)
+    else:
+        # Teardown - reset browser and return it to the pool (contexts mode: dispose the context)
+        pool.release(driver)
 
 
 @pytest.fixture(scope="function")
@@ -107,9 +131,10 @@ def logged_in_driver(driver):
     """
     Fixture that provides a logged-in driver
     Use this for tests that need to start from logged-in state
+    Skips the login form - the real form is covered by test_login.py
     """
     login_page = LoginPage(driver)
-    login_page.login(config.valid_username, config.valid_password)
+    login_page.login_with_session(config.valid_username)
     return driver
 
 
@@ -126,6 +151,18 @@ def pytest_html_report_title(report):
     report.title = "E-commerce Test Automation Report"
 
 
+def pytest_addoption(parser):
+    """Command line overrides for config.ini settings"""
+    parser.addoption(
+        "--profile", action="store", default=None,
+        help="Browser launch profile: default or fast (overrides config.ini)"
+    )
+    parser.addoption(
+        "--schedule", action="store", default=None,
+        help="xdist scheduling: duration or default (overrides config.ini)"
+    )
+
+
 def pytest_configure(config):
     """Create reports directory if it doesn't exist"""
     reports_dir = "reports"
@@ -135,16 +172,222 @@ def pytest_configure(config):
     screenshots_dir = "screenshots"
     if not os.path.exists(screenshots_dir):
         os.makedirs(screenshots_dir)
+    
+    # The controller (or a plain run) owns the merged timing report
+    if not hasattr(config, "workerinput"):
+        command_timer.clear_worker_files()
+    
+    _apply_command_line_overrides(config)
+    _start_local_storefront()
+
+
+def pytest_unconfigure(config):
+    """Stop the local storefront and shared browser, close the Grid connection and persist learned resource sizes"""
+    resource_sizes.save()
+    global _storefront, _shared_browser
+    if _storefront is not None:
+        _storefront.stop()
+        _storefront = None
+    if _shared_browser is not None:
+        _shared_browser.close()
+        _shared_browser = None
+    _close_grid_connection()
+
+
+def _apply_command_line_overrides(pytest_config):
+    """Push command line options into the shared ConfigReader"""
+    profile = pytest_config.getoption("--profile")
+    if profile:
+        config.override('settings', 'profile', profile)
+    schedule = pytest_config.getoption("--schedule")
+    if schedule:
+        config.override('scheduling', 'mode', schedule)
+
+
+def _duration_scheduling_enabled():
+    return config.scheduling_mode == "duration"
+
+
+def _grid_worker_count():
+    if not config.grid_hub_url:
+        return None
+    from utils import grid
+    return grid.worker_count()
+
+
+def _shared_browser_address():
+    """DevTools address of the browser shared in contexts mode, launched on first use"""
+    global _shared_browser
+    if _shared_browser is None:
+        _shared_browser = SharedBrowser(create_shared_browser).start()
+    return _shared_browser.address
+
+
+def _needs_isolated_browser(item):
+    return config.driver_mode == "isolated" or item.get_closest_marker("isolated") is not None
+
+
+def _close_grid_connection():
+    if config.grid_hub_url:
+        from utils import grid
+        grid.close_connection()
+
+
+def _start_local_storefront():
+    """Serve the bundled storefront and point base_url at it (one server per xdist worker)"""
+    global _storefront
+    if not config.use_local_storefront or _storefront is not None:
+        return
+    from storefront import StorefrontServer
+    _storefront = StorefrontServer(config.storefront_host, config.storefront_port).start()
+    config.override('settings', 'base_url', _storefront.url)
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """Run recently failed and smoke tests first when enabled (stable sort keeps file order otherwise)"""
+    items.sort(key=lambda item: duration_history.priority(
+        item.nodeid, smoke=item.get_closest_marker("smoke") is not None
+    ))
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Longest-processing-time-first distribution across xdist workers"""
+    if not _duration_scheduling_enabled() or config.getvalue("dist") not in ("load", "loadgroup"):
+        return None
+    from utils.duration_scheduling import DurationScheduling
+    return DurationScheduling(config, log)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """With a Grid hub, `-n auto` starts one worker per free browser slot instead of per local CPU"""
+    return _grid_worker_count()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """In contexts mode every xdist worker attaches to the controller's shared browser"""
+    if config.driver_mode == "contexts":
+        node.workerinput["browser_address"] = _shared_browser_address()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_teardown(item, nextitem):
+    """Stop keeping pre-spawned browsers when the next test doesn't need an isolated one"""
+    if _prespawner is not None and (nextitem is None or not _needs_isolated_browser(nextitem)):
+        _prespawner.idle()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Start every test with an empty wait audit and attribute commands to it"""
+    wait_audit.drain()
+    step_retry.drain()
+    command_timer.current_test = nodeid
+
+
+def pytest_runtest_logreport(report):
+    """Collect wait timeouts, step retries and network stats (runs on the xdist controller too)"""
+    step_retry.add_test(report.nodeid, dict(report.user_properties).get("retries"))
+    if report.when == "call":
+        flow_summary.add_test(dict(report.user_properties).get("flow_steps"))
+    if report.when == "call" and report.passed:
+        wait_audit.add_passed_test(report.nodeid, dict(report.user_properties).get("wait_timeouts"))
+    if report.when == "teardown":
+        traffic_summary.add_test(report.nodeid, dict(report.user_properties).get("network"))
+        hang_watchdog.add_report(report.nodeid, dict(report.user_properties).get("hang"))
+    duration_history.record(report.nodeid, report.when, report.duration, report.outcome,
+                            smoke="smoke" in report.keywords)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report page-object waits that timed out on the happy path and network savings"""
+    lines = wait_audit.summary_lines()
+    if lines:
+        terminalreporter.section("wait timeouts in passing tests")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    lines = step_retry.summary_lines()
+    if lines:
+        terminalreporter.section("step retries")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    lines = flow_summary.summary_lines()
+    if lines:
+        terminalreporter.section("flow fusion")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    lines = traffic_summary.summary_lines()
+    if lines:
+        terminalreporter.section("network interception")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    lines = hang_watchdog.summary_lines()
+    if lines:
+        terminalreporter.section("hung browsers killed by the watchdog")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    lines = memory_report.summary_lines()
+    if lines:
+        terminalreporter.section("browser memory")
+        for line in lines:
+            terminalreporter.write_line(line)
+    
+    if command_timer.enabled and not hasattr(terminalreporter.config, "workerinput"):
+        lines = command_timer.summary_lines(command_timer.merge_worker_files())
+        if lines:
+            terminalreporter.section("webdriver command timing")
+            for line in lines:
+                terminalreporter.write_line(line)
 
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Take screenshot on test failure"""
+    """Capture failure artifacts (screenshot, DOM, console log) without waiting on disk I/O"""
     outcome = yield
     report = outcome.get_result()
     
+    # Timeouts are attached to the report so xdist ships them to the controller
+    if report.when == "call" and wait_audit.enabled:
+        report.user_properties.append(("wait_timeouts", wait_audit.drain()))
+    
+    # Retries from every phase, so steps in fixtures (e.g. login) are reported too
+    retries = step_retry.drain()
+    if retries:
+        report.user_properties.append(("retries", retries))
+        report.sections.append(("step retries", "\n".join(step_retry.describe(event) for event in retries)))
+    
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("driver") or item.funcargs.get("logged_in_driver")
-        if driver:
-            screenshot_path = f"screenshots/{item.name}.png"
-            driver.save_screenshot(screenshot_path)
\ No newline at end of file
+        if driver and not hang_watchdog.killed_reason(driver):
+            # Raw bytes only - encoding and writing happen on the artifact writer thread
+            manifest = artifact_writer.submit(item.nodeid, capture(driver))
+            report.user_properties.append(("artifacts", manifest))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Let the artifact writer finish and publish this process's timings, history and memory peaks"""
+    artifact_writer.flush()
+    if command_timer.enabled:
+        command_timer.write_worker_file(worker_id())
+    
+    # The controller (or a plain run) sees every report - it alone updates the history
+    if not hasattr(session.config, "workerinput"):
+        duration_history.save()
+    
+    # Workers hand their browser memory peaks to the controller (see pytest_testnodedown)
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["browser_memory"] = browser_supervisor.stats()
+    else:
+        memory_report.add_worker(worker_id(), browser_supervisor.stats())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect a finished xdist worker's browser memory peaks"""
+    memory_report.add_worker(node.gateway.id, getattr(node, "workeroutput", {}).get("browser_memory"))
@@ -8,20 +8,23 @@ from pages.login_page import LoginPage
 from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from utils.config_reader import config
+from utils.session_snapshot import snapshot_cache
 
 
 @pytest.mark.cart
 class TestCart:
     """Test class for Cart functionality"""
     
+    @staticmethod
+    def log_in(driver):
+        """Precondition - logged in on the inventory through the login form"""
+        LoginPage(driver).login(config.valid_username, config.valid_password)
+    
     @pytest.fixture(autouse=True)
     def setup(self, driver):
-        """Login before each test"""
-        login_page = LoginPage(driver)
-        self.products_page = login_page.login(
-            config.valid_username,
-            config.valid_password
-        )
+        """Login before each test - run once per worker, then restored from its snapshot"""
+        snapshot_cache.apply(driver, "cart.logged_in", self.log_in)
+        self.products_page = ProductsPage(driver)
     
     @pytest.mark.smoke
     def test_empty_cart_display(self, driver):
@@ -38,12 +41,12 @@ class TestCart:
     @pytest.mark.smoke
     def test_cart_with_products(self, driver):
         """Verify cart displays added products"""
-        # Add products
-        self.products_page.add_product_to_cart_by_name("sauce-labs-backpack")
-        self.products_page.add_product_to_cart_by_name("sauce-labs-bike-light")
-        
-        # Go to cart
-        cart_page = self.products_page.go_to_cart()
+        # Seed products and open cart directly
+        self.products_page.seed_cart(
+            ["sauce-labs-backpack", "sauce-labs-bike-light"],
+            landing_path="cart.html"
+        )
+        cart_page = CartPage(driver)
         
         assert cart_page.get_cart_item_count() == 2, \
             "Cart should have 2 items"
@@ -55,12 +58,14 @@ class TestCart:
     @pytest.mark.regression
     def test_remove_item_from_cart(self, driver):
         """Verify removing item from cart"""
-        # Add products
-        self.products_page.add_product_to_cart_by_name("sauce-labs-backpack")
-        self.products_page.add_product_to_cart_by_name("sauce-labs-bike-light")
+        # Seed products and open cart directly
+        self.products_page.seed_cart(
+            ["sauce-labs-backpack", "sauce-labs-bike-light"],
+            landing_path="cart.html"
+        )
+        cart_page = CartPage(driver)
         
-        # Go to cart and remove one item
-        cart_page = self.products_page.go_to_cart()
+        # Remove one item
         cart_page.remove_item_by_name("sauce-labs-backpack")
         
         assert cart_page.get_cart_item_count() == 1, \
@@ -116,7 +121,7 @@ class TestCart:
     @pytest.mark.regression
     def test_cart_icon_updates(self, driver):
         """Verify cart icon updates after adding products"""
-        assert not self.products_page.is_cart_badge_displayed(), \
+        assert self.products_page.is_cart_badge_absent(), \
             "Cart badge should not be visible initially"
         
         self.products_page.add_first_product_to_cart()
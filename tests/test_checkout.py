@@ -9,22 +9,24 @@ from pages.products_page import ProductsPage
 from pages.cart_page import CartPage
 from pages.checkout_page import CheckoutPage
 from utils.config_reader import config
+from utils.session_snapshot import snapshot_cache
 
 
 @pytest.mark.checkout
 class TestCheckout:
     """Test class for Checkout functionality"""
     
+    @staticmethod
+    def log_in_with_backpack(driver):
+        """Precondition - logged in through the login form, backpack added from the inventory"""
+        products_page = LoginPage(driver).login(config.valid_username, config.valid_password)
+        products_page.add_product_to_cart_by_name("Sauce Labs Backpack")
+    
     @pytest.fixture(autouse=True)
     def setup(self, driver):
-        """Login and add product before each test"""
-        login_page = LoginPage(driver)
-        self.products_page = login_page.login(
-            config.valid_username,
-            config.valid_password
-        )
-        # Add a product for checkout tests
-        self.products_page.add_product_to_cart_by_name("sauce-labs-backpack")
+        """Login and add product before each test - run once per worker, then restored from its snapshot"""
+        snapshot_cache.apply(driver, "checkout.backpack_in_cart", self.log_in_with_backpack)
+        self.products_page = ProductsPage(driver)
     
     @pytest.mark.smoke
     def test_checkout_page_display(self, driver):
@@ -134,7 +136,7 @@ class TestCheckout:
         
         assert returned_page.is_products_page_displayed(), \
             "User should be redirected to Products page"
-        assert not returned_page.is_cart_badge_displayed(), \
+        assert returned_page.is_cart_badge_absent(), \
             "Cart should be empty after completing order"
     
     @pytest.mark.regression
@@ -180,5 +182,5 @@ class TestCheckout:
         
         # Return home and verify cart is empty
         final_page = checkout_page.click_back_home()
-        assert not final_page.is_cart_badge_displayed(), \
+        assert final_page.is_cart_badge_absent(), \
             "Cart should be empty after order"
@@ -0,0 +1,109 @@
+"""
+test_checkout_flows.py - Checkout matrix run through the flow runner
+Every cart is combined with every checkout ending. Flows sharing a prefix
+(login, cart contents, checkout step one, overview) run it once per worker and
+fork from a snapshot, so each test only performs its own last steps. Under xdist
+run with --dist loadgroup so all flows land on one worker
+"""
+
+import pytest
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from utils.config_reader import config
+from utils.flow_runner import FlowTrie, Step
+
+CARTS = {
+    "backpack": ["sauce-labs-backpack"],
+    "backpack+light": ["sauce-labs-backpack", "sauce-labs-bike-light"],
+    "three-items": ["sauce-labs-bolt-t-shirt", "sauce-labs-fleece-jacket", "sauce-labs-onesie"],
+}
+
+# =============== STEPS ===============
+
+LOG_IN = Step("log in", lambda driver: LoginPage(driver).login_with_session(config.valid_username))
+GO_TO_CART = Step("go to cart", lambda driver: ProductsPage(driver).go_to_cart())
+START_CHECKOUT = Step("start checkout", lambda driver: CartPage(driver).proceed_to_checkout())
+ENTER_DETAILS = Step("enter details",
+                     lambda driver: CheckoutPage(driver).proceed_to_overview("Shivansh", "Bajpai", "208001"))
+FINISH = Step("finish", lambda driver: CheckoutPage(driver).click_finish())
+BACK_HOME = Step("back home", lambda driver: CheckoutPage(driver).click_back_home())
+CANCEL = Step("cancel", lambda driver: CheckoutPage(driver).click_cancel())
+
+
+def add_to_cart(products):
+    return Step(f"add {'+'.join(products)}", lambda driver: ProductsPage(driver).add_products(products))
+
+
+def submit_details(first_name, last_name, postal_code):
+    return Step(
+        f"submit {first_name or '-'}/{last_name or '-'}/{postal_code or '-'}",
+        lambda driver: CheckoutPage(driver).proceed_to_overview(first_name, last_name, postal_code)
+    )
+
+
+# =============== CHECKS ===============
+
+def cart_count_is(count):
+    def check(driver):
+        cart_page = CartPage(driver)
+        assert cart_page.is_cart_page_displayed(), "Cancel should return user to cart page"
+        assert cart_page.get_cart_item_count() == count, f"Cart should still have {count} items"
+    return check
+
+
+def overview_shows_totals(driver):
+    checkout_page = CheckoutPage(driver)
+    assert checkout_page.is_checkout_step_two_displayed(), "User should proceed to checkout overview"
+    for amount in (checkout_page.get_subtotal(), checkout_page.get_tax(), checkout_page.get_total()):
+        assert "$" in amount, f"Summary amount should display a price, got '{amount}'"
+
+
+def order_is_complete(driver):
+    checkout_page = CheckoutPage(driver)
+    assert checkout_page.is_order_successful(), "Order should be successful with thank you message"
+    assert "Thank you" in checkout_page.get_complete_header(), "Complete header should contain 'Thank you'"
+
+
+def cart_is_emptied(driver):
+    products_page = ProductsPage(driver)
+    assert products_page.is_products_page_displayed(), "User should be redirected to Products page"
+    assert products_page.is_cart_badge_absent(), "Cart should be empty after completing order"
+
+
+def error_mentions(text):
+    def check(driver):
+        checkout_page = CheckoutPage(driver)
+        assert checkout_page.is_error_displayed(), "Error should be displayed"
+        assert text in checkout_page.get_error_message_text(), f"Error message should say '{text}'"
+    return check
+
+
+# =============== MATRIX ===============
+
+checkout_flows = FlowTrie()
+for cart_name, products in CARTS.items():
+    at_step_one = [LOG_IN, add_to_cart(products), GO_TO_CART, START_CHECKOUT]
+    at_overview = at_step_one + [ENTER_DETAILS]
+    checkout_flows.add(f"{cart_name}-cancel", at_step_one + [CANCEL], cart_count_is(len(products)))
+    checkout_flows.add(f"{cart_name}-missing-first-name", at_step_one + [submit_details("", "Bajpai", "208001")],
+                       error_mentions("First Name is required"))
+    checkout_flows.add(f"{cart_name}-missing-postal-code", at_step_one + [submit_details("Shivansh", "Bajpai", "")],
+                       error_mentions("Postal Code is required"))
+    checkout_flows.add(f"{cart_name}-overview", at_overview, overview_shows_totals)
+    checkout_flows.add(f"{cart_name}-complete", at_overview + [FINISH], order_is_complete)
+    checkout_flows.add(f"{cart_name}-back-home", at_overview + [FINISH, BACK_HOME], cart_is_emptied)
+
+
+@pytest.mark.checkout
+@pytest.mark.regression
+@pytest.mark.xdist_group("checkout_flows")
+class TestCheckoutFlows:
+    """Checkout matrix - one test per flow, shared prefixes run once"""
+    
+    @pytest.mark.parametrize("flow", checkout_flows.names())
+    def test_checkout_flow(self, driver, request, flow):
+        """Run the flow from its deepest shared snapshot and check where it ends"""
+        result = checkout_flows.run(driver, flow)
+        request.node.user_properties.append(("flow_steps", result))
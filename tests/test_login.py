@@ -32,6 +32,14 @@ class TestLogin:
         assert products_page.get_page_title_text() == "Products", \
             "Page title should be 'Products'"
     
+    @pytest.mark.regression
+    def test_session_login(self, driver, login_page):
+        """Verify session injection lands on Products page without the form"""
+        products_page = login_page.login_with_session(config.valid_username)
+        
+        assert products_page.is_products_page_displayed(), \
+            "Session login should deep-link to Products page"
+    
     @pytest.mark.regression
     def test_invalid_username(self, driver, login_page):
         """Verify login fails with invalid username"""
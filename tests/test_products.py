@@ -15,12 +15,9 @@ class TestProducts:
     
     @pytest.fixture(autouse=True)
     def setup(self, driver):
-        """Login before each test"""
+        """Login before each test (session injection, no UI form)"""
         login_page = LoginPage(driver)
-        self.products_page = login_page.login(
-            config.valid_username,
-            config.valid_password
-        )
+        self.products_page = login_page.login_with_session(config.valid_username)
     
     @pytest.mark.smoke
     def test_products_page_display(self, driver):
@@ -77,9 +74,26 @@ class TestProducts:
         
         # Remove product
         self.products_page.remove_product_from_cart_by_name(product_name)
-        assert not self.products_page.is_cart_badge_displayed(), \
+        assert self.products_page.is_cart_badge_absent(), \
             "Cart badge should not be displayed after removing product"
     
+    @pytest.mark.regression
+    def test_bulk_add_and_clear_cart(self, driver):
+        """Verify batched add/remove operations report changes and update the badge"""
+        products = ["sauce-labs-backpack", "sauce-labs-bike-light", "sauce-labs-onesie"]
+        
+        added = self.products_page.add_products(products)
+        assert added == products, "All requested products should be added"
+        assert self.products_page.get_cart_badge_count() == 3
+        
+        removed = self.products_page.remove_products(["sauce-labs-onesie"])
+        assert removed == ["sauce-labs-onesie"]
+        assert self.products_page.get_cart_badge_count() == 2
+        
+        self.products_page.clear_cart()
+        assert self.products_page.is_cart_badge_absent(), \
+            "Cart badge should not be displayed after clearing the cart"
+    
     @pytest.mark.regression
     def test_sort_by_name_a_to_z(self, driver):
         """Verify sorting products by name A to Z"""
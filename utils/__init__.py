@@ -1,8 +1,20 @@
 """
 Utils package - Contains helper utilities
+Exports are imported on first access, so `from utils.config_reader import config`
+does not pull in Selenium through the wait helper
 """
 
-from utils.config_reader import config
-from utils.wait_helper import WaitHelper
+import importlib
 
-__all__ = ['config', 'WaitHelper']
+_MODULES = {
+    'config': 'utils.config_reader',
+    'WaitHelper': 'utils.wait_helper',
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        return getattr(importlib.import_module(_MODULES[name]), name)
+    raise AttributeError(f"module 'utils' has no attribute '{name}'")
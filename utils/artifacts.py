@@ -0,0 +1,170 @@
+"""
+artifacts.py - Failure artifacts (screenshot, DOM snapshot, console log)
+The test thread only grabs the raw bytes from the browser; compression, hashing
+and disk writes happen on a background writer thread
+
+Layout under screenshot_path:
+    blobs/<sha256[:2]>/<sha256>.<ext>    content-addressed, identical captures stored once
+    <worker>/<test>-<hash>.json          manifest per failed test, keyed by nodeid and worker
+
+Screenshots are stored as WebP when Pillow is installed and text as zstd when
+zstandard is installed; otherwise PNG and gzip are used
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from typing import Dict, Optional
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WEBP_QUALITY = 80
+
+
+def worker_id() -> str:
+    """xdist worker name, or 'main' outside xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def capture(driver: WebDriver) -> Dict[str, bytes]:
+    """
+    Grab raw artifacts from the browser - no encoding or disk I/O here
+    Anything the browser cannot provide (e.g. console log on Firefox) is skipped
+    """
+    captured = {}
+    try:
+        captured["screenshot.png"] = driver.get_screenshot_as_png()
+    except WebDriverException:
+        logger.warning("Could not capture screenshot")
+    try:
+        captured["dom.html"] = driver.page_source.encode("utf-8")
+    except WebDriverException:
+        logger.warning("Could not capture page source")
+    try:
+        captured["console.json"] = json.dumps(driver.get_log("browser"), indent=2).encode("utf-8")
+    except (AttributeError, WebDriverException):
+        pass
+    return captured
+
+
+class ArtifactWriter:
+    """Background thread that compresses, deduplicates and writes artifacts"""
+    
+    def __init__(self, root: Optional[str] = None):
+        self.root = os.path.join(PROJECT_ROOT, root or config.screenshot_path)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+    
+    def submit(self, nodeid: str, artifacts: Dict[str, bytes]) -> str:
+        """
+        Queue artifacts for writing and return the manifest path right away
+        The caller never waits on compression or disk I/O
+        """
+        manifest = os.path.join(self.root, worker_id(), f"{self._slug(nodeid)}.json")
+        if artifacts:
+            self._ensure_started()
+            self._queue.put((nodeid, manifest, artifacts))
+        return manifest
+    
+    def flush(self) -> None:
+        """Block until every queued artifact is on disk (session end only)"""
+        if self._thread is not None:
+            self._queue.join()
+    
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            nodeid, manifest, artifacts = self._queue.get()
+            try:
+                self._write(nodeid, manifest, artifacts)
+            except Exception:
+                logger.exception("Failed to write artifacts for %s", nodeid)
+            finally:
+                self._queue.task_done()
+    
+    def _write(self, nodeid: str, manifest: str, artifacts: Dict[str, bytes]) -> None:
+        entries = {}
+        for name, data in artifacts.items():
+            entries[name] = os.path.relpath(self._store_blob(name, data), self.root)
+        
+        os.makedirs(os.path.dirname(manifest), exist_ok=True)
+        self._atomic_write(manifest, json.dumps({
+            "nodeid": nodeid,
+            "worker": worker_id(),
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "artifacts": entries,
+        }, indent=2).encode("utf-8"))
+    
+    def _store_blob(self, name: str, data: bytes) -> str:
+        """Write a compressed blob named after the hash of its raw content"""
+        digest = hashlib.sha256(data).hexdigest()
+        if name.endswith(".png"):
+            payload, extension = self._encode_image(data)
+        else:
+            payload, extension = self._compress_text(data)
+            extension = os.path.splitext(name)[1] + extension
+        
+        path = os.path.join(self.root, "blobs", digest[:2], f"{digest}{extension}")
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._atomic_write(path, payload)
+        return path
+    
+    @staticmethod
+    def _encode_image(png: bytes):
+        if Image is None:
+            return png, ".png"
+        output = io.BytesIO()
+        Image.open(io.BytesIO(png)).save(output, "WEBP", quality=WEBP_QUALITY)
+        return output.getvalue(), ".webp"
+    
+    @staticmethod
+    def _compress_text(data: bytes):
+        if zstandard is not None:
+            return zstandard.ZstdCompressor().compress(data), ".zst"
+        return gzip.compress(data), ".gz"
+    
+    @staticmethod
+    def _atomic_write(path: str, data: bytes) -> None:
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(temp_path, path)
+    
+    @staticmethod
+    def _slug(nodeid: str) -> str:
+        """Filesystem-safe, collision-free name for a test id (parametrized ids included)"""
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid.split("::", 1)[-1])[:80]
+        return f"{name}-{hashlib.sha1(nodeid.encode('utf-8')).hexdigest()[:8]}"
+
+
+# Create a single instance for easy import
+artifact_writer = ArtifactWriter()
@@ -0,0 +1,113 @@
+"""
+browser_contexts.py - Many isolated tests in one browser process (driver_mode = contexts)
+One Chromium browser is launched for the whole run. Every worker attaches its own
+WebDriver session to it through the DevTools address, and every test runs in a
+fresh browser context (Target.createBrowserContext) - separate cookies, storage
+and cache, like a new incognito profile - which is disposed after the test.
+A context costs a tab's renderer instead of a whole browser per worker
+"""
+
+import logging
+from typing import Callable, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils.driver_pool import SESSION_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+def debugger_address(driver: WebDriver) -> str:
+    """DevTools address of a Chromium session ("goog:chromeOptions" / "ms:edgeOptions")"""
+    for value in driver.capabilities.values():
+        if isinstance(value, dict) and value.get("debuggerAddress"):
+            return value["debuggerAddress"]
+    raise ValueError("The browser session does not report a DevTools address")
+
+
+class SharedBrowser:
+    """The browser hosting every context, owned by the xdist controller (or a plain run)"""
+    
+    def __init__(self, factory: Callable[[], WebDriver]):
+        self.factory = factory
+        self.driver: Optional[WebDriver] = None
+        self.address: Optional[str] = None
+    
+    def start(self) -> 'SharedBrowser':
+        self.driver = self.factory()
+        self.address = debugger_address(self.driver)
+        logger.info("Shared browser for contexts mode listening on %s", self.address)
+        return self
+    
+    def close(self) -> None:
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except SESSION_ERRORS:
+            logger.warning("Shared browser did not quit cleanly")
+        self.driver = None
+
+
+class BrowserContexts:
+    """
+    A worker's session on the shared browser, handing each test a new browser context
+    `prepare` runs on every new context before the base URL loads (e.g. per-tab
+    network interception)
+    """
+    
+    def __init__(self, factory: Callable[[], WebDriver], prepare: Optional[Callable[[WebDriver], None]] = None):
+        self.factory = factory
+        self.prepare = prepare
+        self._driver: Optional[WebDriver] = None
+        self._home: Optional[str] = None
+        self._context_id: Optional[str] = None
+    
+    def acquire(self) -> WebDriver:
+        """Switch the worker's session to a new, empty context on the base URL"""
+        if self._driver is None:
+            self._driver = self.factory()
+            self._home = self._driver.current_window_handle
+        driver = self._driver
+        
+        context_id = driver.execute_cdp_cmd(
+            "Target.createBrowserContext", {"disposeOnDetach": True}
+        )["browserContextId"]
+        target_id = driver.execute_cdp_cmd(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id, "newWindow": True}
+        )["targetId"]
+        self._context_id = context_id
+        # ChromeDriver window handles are DevTools target ids
+        driver.switch_to.window(target_id)
+        if self.prepare is not None:
+            self.prepare(driver)
+        driver.get(config.base_url)
+        return driver
+    
+    def release(self, driver: WebDriver) -> None:
+        """Dispose the test's context with all its tabs and storage"""
+        context_id, self._context_id = self._context_id, None
+        if context_id is None:
+            return
+        try:
+            driver.switch_to.window(self._home)
+            driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except SESSION_ERRORS:
+            logger.warning("Could not dispose browser context, re-attaching for the next test")
+            self.forget(driver)
+    
+    def forget(self, driver: WebDriver) -> None:
+        """Drop a session that no longer answers; the next test attaches a new one"""
+        if driver is not self._driver:
+            return
+        self._driver = None
+        self._context_id = None
+        try:
+            # Ends the attached session only - the shared browser keeps running
+            driver.quit()
+        except SESSION_ERRORS:
+            pass
+    
+    def close(self) -> None:
+        if self._driver is not None:
+            self.release(self._driver)
+            self.forget(self._driver)
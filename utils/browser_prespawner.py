@@ -0,0 +1,154 @@
+"""
+browser_prespawner.py - Keeps fresh browsers launched ahead of time
+Used for isolated mode: every test still gets a brand new browser, but it was
+started on a background thread while the previous test ran, and retired
+browsers are quit there too, so neither launch nor quit sits on the test's path.
+A ready browser is checked before it is handed out, and none are kept while no
+isolated test is queued (idle())
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils.driver_pool import DriverPool
+from utils import process_tree
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPrespawner:
+    """
+    Background launcher holding up to `size` ready browsers on the base URL
+    With size 0 browsers are launched on demand and only quitting is moved off the test
+    """
+    
+    # Pause before retrying after a failed launch or while over the memory ceiling
+    RETRY_DELAY = 1.0
+    
+    def __init__(self, factory: Callable[[], WebDriver], size: Optional[int] = None,
+                 memory_limit_mb: Optional[float] = None):
+        self.factory = factory
+        self.size = size if size is not None else config.prespawn_size
+        self.memory_limit_mb = memory_limit_mb if memory_limit_mb is not None else config.prespawn_memory_limit_mb
+        self._ready: Deque[WebDriver] = deque()
+        self._retired: List[WebDriver] = []
+        self._launching = 0
+        self._stopped = False
+        self._idle = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> 'BrowserPrespawner':
+        self._thread = threading.Thread(target=self._run, name="browser-prespawner", daemon=True)
+        self._thread.start()
+        return self
+    
+    def take(self) -> WebDriver:
+        """
+        Hand out a ready browser that still answers; if one is still launching
+        wait for it, otherwise launch one on the spot
+        """
+        while True:
+            with self._cond:
+                self._idle = False
+                while not self._ready and self._launching:
+                    self._cond.wait()
+                driver = self._ready.popleft() if self._ready else None
+                self._cond.notify_all()
+            if driver is None:
+                break
+            # A standby browser may have died or hit the Grid's idle timeout meanwhile
+            if DriverPool.is_healthy(driver):
+                return driver
+            logger.warning("Discarding a pre-spawned browser that no longer answers")
+            self.retire(driver)
+        
+        logger.info("No pre-spawned browser ready, launching one in the test")
+        return self._launch()
+    
+    def idle(self) -> None:
+        """No isolated test is queued - quit the ready browsers and launch none until the next take()"""
+        with self._cond:
+            self._idle = True
+            self._retired.extend(self._ready)
+            self._ready.clear()
+            self._cond.notify_all()
+    
+    def retire(self, driver: WebDriver) -> None:
+        """Quit a used browser on the background thread"""
+        with self._cond:
+            self._retired.append(driver)
+            self._cond.notify_all()
+    
+    def close(self) -> None:
+        """Stop spawning and quit every ready and retired browser"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        for driver in list(self._ready) + self._retired:
+            self._quit(driver)
+        self._ready.clear()
+        self._retired = []
+    
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopped and not self._retired and not self._wants_browser():
+                    # Re-check periodically - memory frees up as other browsers exit
+                    self._cond.wait(self.RETRY_DELAY)
+                if self._stopped:
+                    return
+                retired, self._retired = self._retired, []
+                launch = not retired
+                if launch:
+                    self._launching += 1
+            
+            # Quit first - it frees memory for the next launch
+            for driver in retired:
+                self._quit(driver)
+            if not launch:
+                continue
+            
+            driver = None
+            try:
+                driver = self._launch()
+            except Exception:
+                # Never let the thread die - take() would wait on a launch that never finishes
+                logger.exception("Pre-spawning a browser failed")
+            with self._cond:
+                self._launching -= 1
+                if driver is not None:
+                    # Launched just before idle() - not needed any more
+                    (self._retired if self._idle else self._ready).append(driver)
+                self._cond.notify_all()
+            if driver is None:
+                time.sleep(self.RETRY_DELAY)
+    
+    def _wants_browser(self) -> bool:
+        """Not idle, below the target count and under the memory ceiling (caller holds the lock)"""
+        if self._idle:
+            return False
+        if len(self._ready) + self._launching >= self.size:
+            return False
+        if self.memory_limit_mb and process_tree.browsers_rss_mb() >= self.memory_limit_mb:
+            return False
+        return True
+    
+    def _launch(self) -> WebDriver:
+        driver = self.factory()
+        driver.get(config.base_url)
+        return driver
+    
+    @staticmethod
+    def _quit(driver: WebDriver) -> None:
+        try:
+            driver.quit()
+        except WebDriverException:
+            logger.warning("Browser did not quit cleanly")
@@ -0,0 +1,84 @@
+"""
+browser_supervisor.py - Memory and wear limits for long-lived browsers
+Samples the RSS of each browser's process tree (driver executable + browser)
+between tests, decides when a pooled browser should be recycled and keeps the
+peak figures for the end-of-session report
+"""
+
+import logging
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils import process_tree
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserSupervisor:
+    """Recycling decisions and peak memory for the browsers of one process"""
+    
+    def __init__(self, max_rss_mb: Optional[float] = None, max_uses: Optional[int] = None):
+        self.max_rss_mb = max_rss_mb if max_rss_mb is not None else config.pool_max_rss_mb
+        self.max_uses = max_uses if max_uses is not None else config.pool_max_uses
+        self.peak_browser_mb = 0.0
+        self.peak_total_mb = 0.0
+        self.recycled = {"memory": 0, "uses": 0}
+        self.samples = 0
+    
+    def sample(self, driver: WebDriver) -> float:
+        """Measure one browser (and all browsers of this process) and update the peaks"""
+        rss = process_tree.session_rss_mb(driver)
+        self.samples += 1
+        self.peak_browser_mb = max(self.peak_browser_mb, rss)
+        self.peak_total_mb = max(self.peak_total_mb, process_tree.browsers_rss_mb())
+        return rss
+    
+    def recycle_reason(self, driver: WebDriver, uses: int) -> Optional[str]:
+        """Why a browser that just finished its `uses`-th test should be replaced, or None"""
+        rss = self.sample(driver)
+        if self.max_rss_mb and rss >= self.max_rss_mb:
+            self.recycled["memory"] += 1
+            return f"{rss:.0f} MB >= {self.max_rss_mb:.0f} MB"
+        if uses >= self.max_uses:
+            self.recycled["uses"] += 1
+            return f"{uses} uses"
+        return None
+    
+    def stats(self) -> Optional[Dict]:
+        """Peaks and recycle counts, or None if no browser was ever sampled"""
+        if not self.samples:
+            return None
+        return {
+            "peak_browser_mb": round(self.peak_browser_mb, 1),
+            "peak_total_mb": round(self.peak_total_mb, 1),
+            "recycled_memory": self.recycled["memory"],
+            "recycled_uses": self.recycled["uses"],
+        }
+
+
+class MemoryReport:
+    """Peak browser memory per worker, collected on the controller"""
+    
+    def __init__(self):
+        self._workers: Dict[str, Dict] = {}
+    
+    def add_worker(self, worker: str, stats: Optional[Dict]) -> None:
+        if stats:
+            self._workers[worker] = stats
+    
+    def summary_lines(self) -> List[str]:
+        lines = []
+        for worker, stats in sorted(self._workers.items()):
+            line = (
+                f"{worker}: peak {stats['peak_total_mb']:.0f} MB for all browsers, "
+                f"{stats['peak_browser_mb']:.0f} MB for one browser; recycled "
+                f"{stats['recycled_memory']} on memory, {stats['recycled_uses']} on uses"
+            )
+            logger.info(line)
+            lines.append(line)
+        return lines
+
+
+# Create single instances for easy import
+browser_supervisor = BrowserSupervisor()
+memory_report = MemoryReport()
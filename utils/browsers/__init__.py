@@ -0,0 +1,40 @@
+"""
+Browser backends - one module per supported browser, imported on first use
+A backend module provides:
+    options(fast) -> Options                     browser options with the launch profile applied
+    launch(fast, browser_options=None) -> WebDriver
+                                                 start a local browser (default: options(fast))
+    install_driver() -> str                      fetch the driver executable (webdriver-manager)
+    attach(address, fast) -> WebDriver           optional, Chromium only - new session on a
+                                                 running browser (driver_mode = contexts)
+Only the selected browser's Selenium and webdriver-manager modules are loaded
+"""
+
+import importlib
+from types import ModuleType
+from typing import Dict, List
+
+# Viewport of the fast launch profile, for every browser
+FAST_WINDOW_SIZE = (1366, 768)
+
+BACKENDS: Dict[str, str] = {
+    "chrome": "utils.browsers.chrome",
+    "firefox": "utils.browsers.firefox",
+    "edge": "utils.browsers.edge",
+}
+
+
+def register(browser: str, module_path: str) -> None:
+    """Add (or replace) the backend module used for a browser name"""
+    BACKENDS[browser] = module_path
+
+
+def supported() -> List[str]:
+    return list(BACKENDS)
+
+
+def get_backend(browser: str) -> ModuleType:
+    """Import the backend module of a browser"""
+    if browser not in BACKENDS:
+        raise ValueError(f"Browser '{browser}' not supported!")
+    return importlib.import_module(BACKENDS[browser])
@@ -0,0 +1,40 @@
+"""
+chrome.py - Chrome backend
+"""
+
+import os
+from typing import Optional
+from selenium.webdriver import Chrome
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.browsers.chromium import attach_options, chromium_options
+from utils.driver_binaries import driver_binaries
+
+
+def options(fast: bool) -> ChromeOptions:
+    return chromium_options(ChromeOptions(), fast)
+
+
+def launch(fast: bool, browser_options: Optional[ChromeOptions] = None) -> WebDriver:
+    # Resolved once per session and cached on disk for all workers
+    service = ChromeService(executable_path=driver_binaries.resolve("chrome"))
+    return Chrome(service=service, options=browser_options or options(fast))
+
+
+def attach(address: str, fast: bool) -> WebDriver:
+    """New session on the Chrome listening at the DevTools address"""
+    service = ChromeService(executable_path=driver_binaries.resolve("chrome"))
+    return Chrome(service=service, options=attach_options(ChromeOptions(), address, fast))
+
+
+def install_driver() -> str:
+    from webdriver_manager.chrome import ChromeDriverManager
+    driver_path = ChromeDriverManager().install()
+    # Fix for webdriver-manager issue - ensure we get the actual
+    # chromedriver executable, not THIRD_PARTY_NOTICES
+    if "THIRD_PARTY" in driver_path:
+        driver_dir = os.path.dirname(driver_path)
+        name = "chromedriver.exe" if os.name == "nt" else "chromedriver"
+        driver_path = os.path.join(driver_dir, name)
+    return driver_path
@@ -0,0 +1,96 @@
+"""
+chromium.py - Options shared by the Chrome and Edge backends
+"""
+
+from typing import List
+from selenium.webdriver.chromium.options import ChromiumOptions
+from utils.config_reader import config
+from utils.browsers import FAST_WINDOW_SIZE
+
+# Chromium background services that only cost CPU and network during tests
+FAST_CHROMIUM_ARGS = [
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-dev-shm-usage",
+    "--metrics-recording-only",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--autoplay-policy=user-gesture-required",
+    "--blink-settings=imagesEnabled=false",
+]
+FAST_CHROMIUM_DISABLED_FEATURES = ["Translate", "OptimizationHints", "MediaRouter"]
+
+# The browser shared by contexts mode runs every test in a tab of its own -
+# keep tabs that are not in front running at full speed
+CONTEXT_HOST_ARGS = [
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+]
+
+
+def chromium_options(options: ChromiumOptions, fast: bool) -> ChromiumOptions:
+    """Options shared by Chrome and Edge"""
+    disabled_features: List[str] = ["PasswordLeakDetection"]
+    
+    if fast:
+        options.add_argument("--headless=new")
+        options.add_argument(f"--window-size={FAST_WINDOW_SIZE[0]},{FAST_WINDOW_SIZE[1]}")
+        options.page_load_strategy = "eager"
+        for argument in FAST_CHROMIUM_ARGS:
+            options.add_argument(argument)
+        disabled_features += FAST_CHROMIUM_DISABLED_FEATURES
+    else:
+        if config.headless:
+            options.add_argument("--headless")
+        options.add_argument("--start-maximized")
+    
+    options.add_argument("--disable-notifications")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    
+    # ============ DISABLE PASSWORD BREACH ALERTS ============
+    # Chromium only honours the last --disable-features switch, so pass them together
+    options.add_argument(f"--disable-features={','.join(disabled_features)}")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    
+    # Disable password manager and save password prompts
+    prefs = {
+        "credentials_enable_service": False,
+        "profile.password_manager_enabled": False,
+        "profile.password_manager_leak_detection": False,
+        "profile.default_content_setting_values.notifications": 2
+    }
+    if fast:
+        prefs["profile.managed_default_content_settings.images"] = 2
+    options.add_experimental_option("prefs", prefs)
+    # =========================================================
+    
+    # Network events feed the per-test traffic stats of the network interceptor
+    if config.network_interception != "off":
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+    
+    return options
+
+
+def attach_options(options: ChromiumOptions, address: str, fast: bool) -> ChromiumOptions:
+    """
+    Options for a session attached to an already running browser (contexts mode)
+    Launch arguments and preferences belong to the browser, only session settings apply
+    """
+    options.debugger_address = address
+    if fast:
+        options.page_load_strategy = "eager"
+    if config.network_interception != "off":
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
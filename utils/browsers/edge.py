@@ -0,0 +1,33 @@
+"""
+edge.py - Microsoft Edge backend
+"""
+
+from typing import Optional
+from selenium.webdriver import Edge
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.browsers.chromium import attach_options, chromium_options
+from utils.driver_binaries import driver_binaries
+
+
+def options(fast: bool) -> EdgeOptions:
+    return chromium_options(EdgeOptions(), fast)
+
+
+def launch(fast: bool, browser_options: Optional[EdgeOptions] = None) -> WebDriver:
+    driver = Edge(service=EdgeService(driver_binaries.resolve("edge")), options=browser_options or options(fast))
+    if not fast:
+        driver.maximize_window()
+    return driver
+
+
+def attach(address: str, fast: bool) -> WebDriver:
+    """New session on the Edge listening at the DevTools address"""
+    return Edge(service=EdgeService(driver_binaries.resolve("edge")),
+                options=attach_options(EdgeOptions(), address, fast))
+
+
+def install_driver() -> str:
+    from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    return EdgeChromiumDriverManager().install()
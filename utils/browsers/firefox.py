@@ -0,0 +1,60 @@
+"""
+firefox.py - Firefox backend
+"""
+
+from typing import Optional
+from selenium.webdriver import Firefox
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils.browsers import FAST_WINDOW_SIZE
+from utils.driver_binaries import driver_binaries
+
+FAST_FIREFOX_PREFS = {
+    "permissions.default.image": 2,
+    "media.autoplay.default": 5,
+    "media.autoplay.blocking_policy": 2,
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.page": 0,
+    "browser.safebrowsing.malware.enabled": False,
+    "browser.safebrowsing.phishing.enabled": False,
+    "datareporting.healthreport.uploadEnabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+    "toolkit.telemetry.enabled": False,
+    "extensions.update.enabled": False,
+    "app.update.auto": False,
+    "network.prefetch-next": False,
+}
+
+
+def options(fast: bool) -> FirefoxOptions:
+    return firefox_options(fast)
+
+
+def launch(fast: bool, browser_options: Optional[FirefoxOptions] = None) -> WebDriver:
+    driver = Firefox(service=FirefoxService(driver_binaries.resolve("firefox")),
+                     options=browser_options or options(fast))
+    if not fast:
+        driver.maximize_window()
+    return driver
+
+
+def install_driver() -> str:
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+def firefox_options(fast: bool) -> FirefoxOptions:
+    """Firefox equivalent of the Chromium options"""
+    options = FirefoxOptions()
+    if fast:
+        options.add_argument("--headless")
+        options.add_argument(f"--width={FAST_WINDOW_SIZE[0]}")
+        options.add_argument(f"--height={FAST_WINDOW_SIZE[1]}")
+        options.page_load_strategy = "eager"
+        for name, value in FAST_FIREFOX_PREFS.items():
+            options.set_preference(name, value)
+    elif config.headless:
+        options.add_argument("--headless")
+    return options
@@ -0,0 +1,28 @@
+"""
+call_context.py - Works out which page-object method issued a WebDriver call
+Used to attribute waits and commands back to the page layer
+"""
+
+import sys
+from typing import Optional
+
+
+def _is_page_object(instance) -> bool:
+    return type(instance).__module__.startswith("pages.")
+
+
+def page_object_caller() -> Optional[str]:
+    """
+    Return 'ClassName.method' of the outermost page-object method on the
+    current call stack (the one a test called), or None outside page objects
+    """
+    frame = sys._getframe(1)
+    caller = None
+    while frame is not None:
+        instance = frame.f_locals.get("self")
+        if instance is not None and _is_page_object(instance):
+            caller = f"{type(instance).__name__}.{frame.f_code.co_name}"
+        elif caller is not None:
+            break
+        frame = frame.f_back
+    return caller
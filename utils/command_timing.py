@@ -0,0 +1,153 @@
+"""
+command_timing.py - Times every WebDriver command
+Each command is attributed to the page-object method that issued it and to the
+running test, so suite time can be split into waits, clicks, navigation and startup
+
+Every process (each xdist worker) writes its raw samples to
+reports/command_timing-<worker>.json; the controller merges them into
+reports/command_timing.json and prints the summary
+"""
+
+import glob
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.call_context import page_object_caller
+from utils.config_reader import config
+
+REPORTS_DIR = "reports"
+OUTSIDE_PAGES = "<test/fixture>"
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+class CommandTimer:
+    """Records WebDriver command durations per page-object method and per test"""
+    
+    def __init__(self):
+        self.current_test: Optional[str] = None
+        self._samples: Dict[str, List[float]] = defaultdict(list)
+        self._tests: Dict[str, float] = defaultdict(float)
+        # Pre-spawner and teardown threads record commands too
+        self._lock = threading.Lock()
+    
+    @property
+    def enabled(self) -> bool:
+        return config.command_timing
+    
+    def instrument(self, driver: WebDriver) -> WebDriver:
+        """Wrap driver.execute on this instance so every command is timed"""
+        if not self.enabled:
+            return driver
+        execute = driver.execute
+        
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - start)
+        
+        driver.execute = timed_execute
+        return driver
+    
+    @contextmanager
+    def timing(self, command: str):
+        """Time a block that is not a single WebDriver command (e.g. browser startup)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.record(command, time.perf_counter() - start)
+    
+    def record(self, command: str, duration: float) -> None:
+        caller = page_object_caller() or OUTSIDE_PAGES
+        # Only the test thread works for the running test - background launches
+        # and quits are not charged to whichever test happens to be running
+        on_test_thread = threading.current_thread() is threading.main_thread()
+        with self._lock:
+            self._samples[f"{caller} {command}"].append(duration)
+            if self.current_test and on_test_thread:
+                self._tests[self.current_test] += duration
+    
+    # =============== EXPORT ===============
+    
+    def write_worker_file(self, worker: str) -> None:
+        """Dump this process's raw samples for the controller to merge"""
+        with self._lock:
+            samples = {key: list(durations) for key, durations in self._samples.items()}
+            tests = dict(self._tests)
+        if not samples:
+            return
+        os.makedirs(REPORTS_DIR, exist_ok=True)
+        with open(os.path.join(REPORTS_DIR, f"command_timing-{worker}.json"), "w") as handle:
+            json.dump({"samples": samples, "tests": tests}, handle)
+    
+    @staticmethod
+    def clear_worker_files() -> None:
+        """Remove per-worker files left over from a previous run"""
+        for path in glob.glob(os.path.join(REPORTS_DIR, "command_timing-*.json")):
+            os.remove(path)
+    
+    @staticmethod
+    def merge_worker_files() -> Dict:
+        """Combine every worker's samples into per-key statistics and write the session JSON"""
+        samples: Dict[str, List[float]] = defaultdict(list)
+        tests: Dict[str, float] = defaultdict(float)
+        for path in glob.glob(os.path.join(REPORTS_DIR, "command_timing-*.json")):
+            with open(path) as handle:
+                data = json.load(handle)
+            for key, durations in data["samples"].items():
+                samples[key].extend(durations)
+            for nodeid, total in data["tests"].items():
+                tests[nodeid] += total
+        
+        commands = {}
+        for key, durations in samples.items():
+            caller, command = key.rsplit(" ", 1)
+            commands[key] = {
+                "caller": caller,
+                "command": command,
+                "count": len(durations),
+                "total": round(sum(durations), 4),
+                "p50": round(percentile(durations, 0.50), 4),
+                "p95": round(percentile(durations, 0.95), 4),
+                "max": round(max(durations), 4),
+            }
+        session = {
+            "commands": dict(sorted(commands.items(), key=lambda item: -item[1]["total"])),
+            "tests": dict(sorted(tests.items(), key=lambda item: -item[1])),
+        }
+        if commands:
+            with open(os.path.join(REPORTS_DIR, "command_timing.json"), "w") as handle:
+                json.dump(session, handle, indent=2)
+        return session
+    
+    @staticmethod
+    def summary_lines(session: Dict, limit: int = 15) -> List[str]:
+        """Slowest page-object method / command pairs by total time"""
+        if not session["commands"]:
+            return []
+        lines = [f"{'caller':<45} {'command':<24} {'count':>6} {'total':>8} {'p50':>7} {'p95':>7} {'max':>7}"]
+        for stats in list(session["commands"].values())[:limit]:
+            lines.append(
+                f"{stats['caller']:<45} {stats['command']:<24} {stats['count']:>6} "
+                f"{stats['total']:>7.2f}s {stats['p50']:>6.3f}s {stats['p95']:>6.3f}s {stats['max']:>6.3f}s"
+            )
+        lines.append(f"full breakdown: {os.path.join(REPORTS_DIR, 'command_timing.json')}")
+        return lines
+
+
+# Create a single instance for easy import
+command_timer = CommandTimer()
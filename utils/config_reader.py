@@ -19,6 +19,10 @@ class ConfigReader:
             cls._config.read(config_path)
         return cls._instance
     
+    def override(self, section: str, option: str, value: str) -> None:
+        """Override a setting for the current process (e.g. from the command line)"""
+        self._config.set(section, option, value)
+    
     @property
     def base_url(self) -> str:
         return self._config.get('settings', 'base_url')
@@ -31,6 +35,10 @@ class ConfigReader:
     def headless(self) -> bool:
         return self._config.get('settings', 'headless').lower() == 'true'
     
+    @property
+    def profile(self) -> str:
+        return self._config.get('settings', 'profile').lower()
+    
     @property
     def implicit_wait(self) -> int:
         return int(self._config.get('settings', 'implicit_wait'))
@@ -39,6 +47,150 @@ class ConfigReader:
     def explicit_wait(self) -> int:
         return int(self._config.get('settings', 'explicit_wait'))
     
+    @property
+    def page_load_timeout(self) -> int:
+        return int(self._config.get('settings', 'page_load_timeout'))
+    
+    @property
+    def negative_wait(self) -> float:
+        return float(self._config.get('settings', 'negative_wait'))
+    
+    @property
+    def wait_engine(self) -> str:
+        return self._config.get('settings', 'wait_engine').lower()
+    
+    @property
+    def wait_audit(self) -> bool:
+        return self._config.get('settings', 'wait_audit').lower() == 'true'
+    
+    @property
+    def command_timing(self) -> bool:
+        return self._config.get('settings', 'command_timing').lower() == 'true'
+    
+    @property
+    def driver_mode(self) -> str:
+        return self._config.get('settings', 'driver_mode').lower()
+    
+    @property
+    def watchdog_enabled(self) -> bool:
+        return self._config.get('watchdog', 'enabled').lower() == 'true'
+    
+    @property
+    def watchdog_command_timeout(self) -> float:
+        return float(self._config.get('watchdog', 'command_timeout'))
+    
+    @property
+    def watchdog_test_timeout(self) -> float:
+        return float(self._config.get('watchdog', 'test_timeout'))
+    
+    @property
+    def step_attempts(self) -> int:
+        return int(self._config.get('retry', 'step_attempts'))
+    
+    @property
+    def step_backoff(self) -> float:
+        return float(self._config.get('retry', 'step_backoff'))
+    
+    @property
+    def snapshots_enabled(self) -> bool:
+        return self._config.get('snapshots', 'enabled').lower() == 'true'
+    
+    @property
+    def snapshot_cache_dir(self) -> str:
+        return self._config.get('snapshots', 'cache_dir')
+    
+    @property
+    def grid_hub_url(self) -> str:
+        return self._config.get('grid', 'hub_url').strip()
+    
+    @property
+    def pool_size(self) -> int:
+        return int(self._config.get('pool', 'pool_size'))
+    
+    @property
+    def pool_max_uses(self) -> int:
+        return int(self._config.get('pool', 'max_uses'))
+    
+    @property
+    def pool_max_rss_mb(self) -> float:
+        return float(self._config.get('pool', 'max_rss_mb'))
+    
+    @property
+    def prespawn_size(self) -> int:
+        return int(self._config.get('prespawn', 'size'))
+    
+    @property
+    def prespawn_memory_limit_mb(self) -> float:
+        return float(self._config.get('prespawn', 'memory_limit_mb'))
+    
+    @property
+    def use_local_storefront(self) -> bool:
+        return self._config.get('storefront', 'use_local').lower() == 'true'
+    
+    @property
+    def storefront_host(self) -> str:
+        return self._config.get('storefront', 'host')
+    
+    @property
+    def storefront_port(self) -> int:
+        return int(self._config.get('storefront', 'port'))
+    
+    @property
+    def offline_drivers(self) -> bool:
+        return self._config.get('drivers', 'offline').lower() == 'true'
+    
+    @property
+    def driver_cache_dir(self) -> str:
+        return self._config.get('drivers', 'cache_dir')
+    
+    @property
+    def driver_cache_ttl_hours(self) -> float:
+        return float(self._config.get('drivers', 'cache_ttl_hours'))
+    
+    def driver_path(self, browser: str) -> str:
+        """Pinned driver executable for a browser ('' when not pinned)"""
+        return self._config.get('drivers', f'{browser}_driver_path', fallback='').strip()
+    
+    @property
+    def network_interception(self) -> str:
+        return self._config.get('network', 'interception').lower()
+    
+    @property
+    def network_blocklist(self) -> list:
+        patterns = self._config.get('network', 'blocklist').split(',')
+        return [pattern.strip() for pattern in patterns if pattern.strip()]
+    
+    @property
+    def network_size_table(self) -> str:
+        return self._config.get('network', 'size_table')
+    
+    @property
+    def network_stubs(self) -> dict:
+        """URL glob -> local response file, from [network_stubs]"""
+        if not self._config.has_section('network_stubs'):
+            return {}
+        return dict(self._config.items('network_stubs'))
+    
+    @property
+    def scheduling_mode(self) -> str:
+        return self._config.get('scheduling', 'mode').lower()
+    
+    @property
+    def failed_first(self) -> bool:
+        return self._config.get('scheduling', 'failed_first').lower() == 'true'
+    
+    @property
+    def smoke_first(self) -> bool:
+        return self._config.get('scheduling', 'smoke_first').lower() == 'true'
+    
+    @property
+    def history_file(self) -> str:
+        return self._config.get('scheduling', 'history_file')
+    
+    @property
+    def history_smoothing(self) -> float:
+        return float(self._config.get('scheduling', 'smoothing'))
+    
     @property
     def valid_username(self) -> str:
         return self._config.get('credentials', 'valid_username')
@@ -0,0 +1,172 @@
+"""
+dom_scripts.py - JavaScript snippets run in the page through execute_script
+Lets page objects resolve Selenium locators in-page and batch work into one round trip
+"""
+
+from typing import List, Tuple
+
+# Defines findAll(using, value) for every Selenium locator strategy
+FIND_ALL_JS = """
+function findAll(using, value) {
+    switch (using) {
+        case "id":
+            return Array.from(document.querySelectorAll('[id="' + value.replace(/["\\\\]/g, '\\\\$&') + '"]'));
+        case "class name":
+            return Array.from(document.getElementsByClassName(value));
+        case "css selector":
+            return Array.from(document.querySelectorAll(value));
+        case "name":
+            return Array.from(document.getElementsByName(value));
+        case "tag name":
+            return Array.from(document.getElementsByTagName(value));
+        case "link text":
+        case "partial link text":
+            return Array.from(document.getElementsByTagName("a")).filter(function (link) {
+                var text = link.innerText.trim();
+                return using === "link text" ? text === value : text.indexOf(value) !== -1;
+            });
+        case "xpath":
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) { nodes.push(snapshot.snapshotItem(i)); }
+            return nodes;
+    }
+    throw new Error("Unsupported locator strategy: " + using);
+}
+"""
+
+# arguments[0]: [[using, value], ...]   arguments[1]: attribute names
+# Returns one list per locator of {"text": ..., <attribute>: ...} records
+READ_ELEMENTS_JS = FIND_ALL_JS + """
+var locators = arguments[0], attributes = arguments[1];
+return locators.map(function (locator) {
+    return findAll(locator[0], locator[1]).map(function (element) {
+        var record = {text: (element.innerText || "").trim()};
+        attributes.forEach(function (name) { record[name] = element.getAttribute(name); });
+        return record;
+    });
+});
+"""
+
+
+def locator_args(locators: List[Tuple[str, str]]) -> List[List[str]]:
+    """Convert (By, value) tuples to JSON-friendly [using, value] pairs"""
+    return [[by, value] for by, value in locators]
+
+
+# Async - arguments[0]: [[using, value], ...]   arguments[1]: max clicks or null
+# arguments[2]: optional [using, value] whose texts are read before clicking
+# arguments[3]: quiet period in ms   arguments[4]: settle timeout in ms
+# Targets are snapshotted first and re-resolved by id before each click,
+# so re-rendering after a click doesn't invalidate the remaining targets.
+# Storefronts that batch renders (e.g. React) update the DOM after the click
+# handlers return, so the result is read once the DOM has had no mutations for
+# the quiet period (or the settle timeout passed). Calls back with the ids of
+# the clicks that took effect: the add-to-cart-/remove- counterpart id now
+# exists, or the clicked element is gone (e.g. its cart row)
+CLICK_ALL_JS = FIND_ALL_JS + """
+var locators = arguments[0], limit = arguments[1], readLocator = arguments[2];
+var quietMs = arguments[3], settleMs = arguments[4], done = arguments[arguments.length - 1];
+var texts = readLocator ? findAll(readLocator[0], readLocator[1]).map(function (element) {
+    return (element.innerText || "").trim();
+}) : [];
+var targets = [];
+locators.forEach(function (locator) {
+    findAll(locator[0], locator[1]).forEach(function (element) {
+        if (targets.indexOf(element) === -1) { targets.push(element); }
+    });
+});
+if (limit !== null) { targets = targets.slice(0, limit); }
+var ids = targets.map(function (element) { return element.id; });
+var clicked = [];
+targets.forEach(function (element, index) {
+    var current = (ids[index] && document.getElementById(ids[index])) || element;
+    if (!current.isConnected || current.disabled) { return; }
+    current.click();
+    clicked.push({id: ids[index], element: current});
+});
+function counterpart(id) {
+    if (id.indexOf("add-to-cart-") === 0) { return "remove-" + id.slice("add-to-cart-".length); }
+    if (id.indexOf("remove-") === 0) { return "add-to-cart-" + id.slice("remove-".length); }
+    return null;
+}
+var finished = false, quiet = null, timer = null;
+function finish() {
+    if (finished) { return; }
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quiet);
+    clearTimeout(timer);
+    var changed = clicked.filter(function (click) {
+        var other = click.id && counterpart(click.id);
+        if (other && document.getElementById(other)) { return true; }
+        return click.id ? !document.getElementById(click.id) : !click.element.isConnected;
+    }).map(function (click) { return click.id; });
+    done({changed: changed, texts: texts});
+}
+var observer = new MutationObserver(function () {
+    clearTimeout(quiet);
+    quiet = setTimeout(finish, quietMs);
+});
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+quiet = setTimeout(finish, quietMs);
+timer = setTimeout(finish, settleMs);
+"""
+
+# Async - arguments[0]: {type, using, value, expected}   arguments[1]: timeout in ms
+# Checks the condition now and again on every DOM mutation (plus a short interval
+# for style-only changes), then calls back with the result, or null on timeout.
+# Element conditions return the element(s); a broken condition returns {waitError}
+WAIT_FOR_JS = FIND_ALL_JS + """
+var spec = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+function isVisible(element) {
+    if (!element.isConnected || element.getClientRects().length === 0) { return false; }
+    var visibility = window.getComputedStyle(element).visibility;
+    if (visibility === "hidden" || visibility === "collapse") { return false; }
+    for (var node = element; node && node.nodeType === 1; node = node.parentElement) {
+        var style = window.getComputedStyle(node);
+        if (style.display === "none" || style.opacity === "0") { return false; }
+    }
+    return true;
+}
+function evaluate() {
+    if (spec.type === "url_contains") { return window.location.href.indexOf(spec.expected) !== -1; }
+    if (spec.type === "url_to_be") { return window.location.href === spec.expected; }
+    var matches = findAll(spec.using, spec.value), first = matches[0];
+    switch (spec.type) {
+        case "present": return first || false;
+        case "visible": return first && isVisible(first) ? first : false;
+        case "clickable": return first && isVisible(first) && !first.disabled ? first : false;
+        case "all_visible": return matches.length && matches.every(isVisible) ? matches : false;
+        case "invisible": return !first || !isVisible(first);
+        case "text_contains": return !!first && (first.innerText || "").indexOf(spec.expected) !== -1;
+        case "text_to_be": return !!first && (first.innerText || "").trim() === spec.expected;
+        case "count": return matches.length === spec.expected;
+    }
+    throw new Error("Unsupported wait condition: " + spec.type);
+}
+var finished = false, observer = null, interval = null, timer = null;
+function finish(result) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearInterval(interval);
+    clearTimeout(timer);
+    done(result);
+}
+function check() {
+    try {
+        var result = evaluate();
+        if (result) { finish(result); }
+    } catch (error) {
+        finish({waitError: String(error)});
+    }
+}
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, characterData: true});
+    interval = setInterval(check, 100);
+    timer = setTimeout(function () { finish(null); }, timeoutMs);
+}
+"""
@@ -0,0 +1,91 @@
+"""
+driver_binaries.py - Resolves browser driver executables once per session
+The result is shared across xdist workers through a lock-protected on-disk cache,
+so per-test driver lookup costs nothing and cold lookups happen once per machine
+"""
+
+import json
+import logging
+import os
+import time
+from typing import Dict
+from filelock import FileLock
+from utils.config_reader import config
+from utils.browsers import get_backend
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class DriverBinaryResolver:
+    """Finds the driver executable for a browser: pinned path, then cache, then webdriver-manager"""
+    
+    def __init__(self):
+        self.cache_dir = os.path.join(PROJECT_ROOT, config.driver_cache_dir)
+        self.cache_file = os.path.join(self.cache_dir, "drivers.json")
+        self._resolved: Dict[str, str] = {}
+    
+    def resolve(self, browser: str) -> str:
+        """Return the driver executable path for `browser`, resolving at most once per process"""
+        if browser not in self._resolved:
+            self._resolved[browser] = self._resolve_uncached(browser)
+        return self._resolved[browser]
+    
+    def _resolve_uncached(self, browser: str) -> str:
+        pinned = config.driver_path(browser)
+        if pinned:
+            if not os.path.isfile(pinned):
+                raise FileNotFoundError(f"Pinned {browser} driver not found: {pinned}")
+            return pinned
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # One worker installs while the others wait, then everyone reads the cache
+        with FileLock(self.cache_file + ".lock"):
+            cache = self._read_cache()
+            entry = cache.get(browser)
+            if entry and self._is_usable(entry):
+                return entry["path"]
+            
+            if config.offline_drivers:
+                raise RuntimeError(
+                    f"No cached {browser} driver and offline mode is on - "
+                    f"set {browser}_driver_path under [drivers] in config.ini"
+                )
+            
+            path = self._install(browser)
+            cache[browser] = {"path": path, "resolved_at": time.time()}
+            self._write_cache(cache)
+            logger.info("Resolved %s driver: %s", browser, path)
+            return path
+    
+    def _is_usable(self, entry: Dict) -> bool:
+        if not os.path.isfile(entry.get("path", "")):
+            return False
+        # Offline runs keep whatever was cached; online runs refresh stale entries
+        if config.offline_drivers:
+            return True
+        age_hours = (time.time() - entry.get("resolved_at", 0)) / 3600
+        return age_hours < config.driver_cache_ttl_hours
+    
+    @staticmethod
+    def _install(browser: str) -> str:
+        """Download or locate the driver through the browser backend (webdriver-manager)"""
+        return get_backend(browser).install_driver()
+    
+    def _read_cache(self) -> Dict:
+        try:
+            with open(self.cache_file) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+    
+    def _write_cache(self, cache: Dict) -> None:
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, "w") as cache_file:
+            json.dump(cache, cache_file, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+
+# Create a single instance for easy import
+driver_binaries = DriverBinaryResolver()
@@ -0,0 +1,81 @@
+"""
+driver_factory.py - Creates configured WebDriver instances
+Shared by the per-test fixture and the browser pool. Browser specifics live in
+utils/browsers/, and only the configured browser's backend is imported.
+With [grid] hub_url set, browsers are started on the Grid (utils/grid.py)
+
+In contexts mode one browser from create_shared_browser() hosts every test and each
+worker drives it through a session from attach_driver() (utils/browser_contexts.py)
+
+Launch profiles:
+    default - headed (unless headless = true), maximized, everything loaded
+    fast    - CI throughput: headless, fixed viewport, eager page loads,
+              no images/media, no browser background services
+"""
+
+from typing import Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils.browsers import get_backend
+from utils.wait_helper import WaitHelper
+
+PROFILES = ("default", "fast")
+
+# Headroom on top of the longest async wait before the driver aborts the script
+SCRIPT_TIMEOUT_MARGIN = 10
+
+
+def create_driver(profile: Optional[str] = None) -> WebDriver:
+    """
+    Launch a new browser for the configured browser type and launch profile
+    The returned driver has implicit wait applied but no page loaded
+    """
+    profile = profile or config.profile
+    if profile not in PROFILES:
+        raise ValueError(f"Profile '{profile}' not supported! Use one of {PROFILES}")
+    
+    backend = get_backend(config.browser)
+    fast = profile == "fast"
+    if config.grid_hub_url:
+        from utils import grid
+        driver = grid.launch(backend.options(fast), fast)
+    else:
+        driver = backend.launch(fast)
+    return _apply_timeouts(driver)
+
+
+def create_shared_browser(profile: Optional[str] = None) -> WebDriver:
+    """
+    Launch the Chromium browser whose contexts host every test in contexts mode
+    Tests never use this session - workers attach their own with attach_driver()
+    """
+    profile = profile or config.profile
+    fast = profile == "fast"
+    backend = get_backend(config.browser)
+    if not hasattr(backend, "attach"):
+        raise ValueError(f"driver_mode = contexts needs a Chromium browser, not '{config.browser}'")
+    if config.grid_hub_url:
+        raise ValueError("driver_mode = contexts needs a local browser - unset [grid] hub_url")
+    
+    from utils.browsers.chromium import CONTEXT_HOST_ARGS
+    options = backend.options(fast)
+    for argument in CONTEXT_HOST_ARGS:
+        options.add_argument(argument)
+    return backend.launch(fast, options)
+
+
+def attach_driver(address: str, profile: Optional[str] = None) -> WebDriver:
+    """New WebDriver session on the shared browser listening at a DevTools address"""
+    profile = profile or config.profile
+    return _apply_timeouts(get_backend(config.browser).attach(address, fast=profile == "fast"))
+
+
+def _apply_timeouts(driver: WebDriver) -> WebDriver:
+    # Set implicit wait and the upper bound for page loads
+    driver.implicitly_wait(config.implicit_wait)
+    driver.set_page_load_timeout(config.page_load_timeout)
+    
+    # Event-driven waits block inside execute_async_script
+    driver.set_script_timeout(WaitHelper.MAX_SCRIPT_WAIT + SCRIPT_TIMEOUT_MARGIN)
+    
+    return driver
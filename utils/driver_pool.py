@@ -0,0 +1,126 @@
+"""
+driver_pool.py - Keeps browsers alive across tests
+Each pytest session (or xdist worker) owns one pool, so browsers are never shared between processes
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+from urllib3.exceptions import HTTPError
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils.browser_supervisor import BrowserSupervisor, browser_supervisor
+
+logger = logging.getLogger(__name__)
+
+# A browser whose driver process died fails at the HTTP layer instead of with a WebDriverException
+SESSION_ERRORS = (WebDriverException, HTTPError)
+
+
+class DriverPool:
+    """Hands out reusable browsers and resets them between tests"""
+    
+    def __init__(self, factory: Callable[[], WebDriver],
+                 size: Optional[int] = None, max_uses: Optional[int] = None,
+                 supervisor: Optional[BrowserSupervisor] = None):
+        self.factory = factory
+        self.size = size if size is not None else config.pool_size
+        self.supervisor = supervisor or (
+            BrowserSupervisor(max_uses=max_uses) if max_uses is not None else browser_supervisor
+        )
+        self._idle: List[WebDriver] = []
+        self._uses: Dict[WebDriver, int] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> WebDriver:
+        """Return a healthy browser on the base URL, launching one if none is idle"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if self.is_healthy(driver):
+                return driver
+            logger.warning("Discarding unresponsive pooled browser")
+            self._discard(driver)
+        
+        driver = self.factory()
+        driver.get(config.base_url)
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+    
+    def release(self, driver: WebDriver) -> None:
+        """Return a browser to the pool, recycling it when it is worn out, too big or broken"""
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            uses = self._uses[driver]
+            pool_full = len(self._idle) >= self.size
+        
+        recycle_reason = self.supervisor.recycle_reason(driver, uses)
+        if recycle_reason:
+            logger.info("Recycling pooled browser: %s", recycle_reason)
+        if recycle_reason or pool_full:
+            self._discard(driver)
+            return
+        
+        try:
+            self.reset(driver)
+        except SESSION_ERRORS:
+            logger.warning("Pooled browser failed to reset, recycling it")
+            self._discard(driver)
+            return
+        
+        with self._lock:
+            self._idle.append(driver)
+    
+    def reset(self, driver: WebDriver) -> None:
+        """
+        Bring a browser back to a fresh state:
+        extra windows closed, cookies and web storage cleared, base URL loaded
+        """
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        
+        # Storage can only be cleared for the origin that is currently loaded
+        if not driver.current_url.startswith(config.base_url):
+            driver.get(config.base_url)
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        
+        driver.get(config.base_url)
+    
+    def forget(self, driver: WebDriver) -> None:
+        """Drop a browser that is already gone (e.g. killed by the hang watchdog)"""
+        with self._lock:
+            self._uses.pop(driver, None)
+            if driver in self._idle:
+                self._idle.remove(driver)
+    
+    @staticmethod
+    def is_healthy(driver: WebDriver) -> bool:
+        """Check the browser session still answers commands"""
+        try:
+            driver.current_window_handle
+            return True
+        except SESSION_ERRORS:
+            return False
+    
+    def close(self) -> None:
+        """Quit every idle browser"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+    
+    def _discard(self, driver: WebDriver) -> None:
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except SESSION_ERRORS:
+            logger.warning("Browser did not quit cleanly")
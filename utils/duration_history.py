@@ -0,0 +1,131 @@
+"""
+duration_history.py - Per-test duration history shared between runs
+Keeps an exponentially weighted average of setup, call and teardown time plus the
+last outcome of every test, used to schedule long tests first and failures early
+"""
+
+import json
+import os
+import statistics
+import time
+from typing import Dict, List, Optional
+from filelock import FileLock
+from utils.config_reader import config
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = ("setup", "call", "teardown")
+
+# Estimate for a test nobody has timed yet when there is no history at all
+DEFAULT_ESTIMATE = 5.0
+
+
+class DurationHistory:
+    """Duration averages and last outcomes, persisted as JSON behind a file lock"""
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = os.path.join(PROJECT_ROOT, path or config.history_file)
+        self._entries: Optional[Dict[str, Dict]] = None
+        self._run: Dict[str, Dict] = {}
+    
+    @property
+    def entries(self) -> Dict[str, Dict]:
+        """History as of the start of this run"""
+        if self._entries is None:
+            try:
+                with open(self.path) as handle:
+                    self._entries = json.load(handle)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+    
+    # =============== RECORDING ===============
+    
+    def record(self, nodeid: str, when: str, duration: float, outcome: str, smoke: bool = False) -> None:
+        """Note one phase of a test from this run"""
+        run = self._run.setdefault(nodeid, {"outcome": "passed", "smoke": smoke})
+        run[when] = duration
+        if outcome == "failed":
+            run["outcome"] = "failed"
+        elif outcome == "skipped" and when != "teardown":
+            run["outcome"] = "skipped"
+    
+    def save(self) -> None:
+        """Fold this run into the stored averages"""
+        if not self._run:
+            return
+        smoothing = config.history_smoothing
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with FileLock(self.path + ".lock"):
+            try:
+                with open(self.path) as handle:
+                    stored = json.load(handle)
+            except (OSError, ValueError):
+                stored = {}
+            
+            for nodeid, run in self._run.items():
+                entry = stored.setdefault(nodeid, {"runs": 0})
+                entry["last_outcome"] = run["outcome"]
+                entry["smoke"] = run["smoke"]
+                if run["outcome"] == "failed":
+                    entry["last_failed"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+                # Skipped tests say nothing about how long the test really takes
+                if run["outcome"] == "skipped":
+                    continue
+                for phase in PHASES:
+                    if phase in run:
+                        previous = entry.get(phase)
+                        entry[phase] = round(run[phase] if previous is None
+                                             else smoothing * run[phase] + (1 - smoothing) * previous, 4)
+                entry["runs"] += 1
+            
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as handle:
+                json.dump(stored, handle, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        self._run = {}
+    
+    # =============== QUERIES ===============
+    
+    def expected_duration(self, nodeid: str, default: Optional[float] = None) -> float:
+        """Average setup + call + teardown time, or `default` for an unknown test"""
+        entry = self.entries.get(nodeid)
+        if not entry or not any(phase in entry for phase in PHASES):
+            return default if default is not None else self.typical_duration()
+        return sum(entry.get(phase, 0.0) for phase in PHASES)
+    
+    def typical_duration(self) -> float:
+        """Median known duration - the estimate for tests without history"""
+        known = [
+            sum(entry.get(phase, 0.0) for phase in PHASES)
+            for entry in self.entries.values()
+            if any(phase in entry for phase in PHASES)
+        ]
+        return statistics.median(known) if known else DEFAULT_ESTIMATE
+    
+    def priority(self, nodeid: str, smoke: Optional[bool] = None) -> int:
+        """0 - failed last run, 1 - smoke test, 2 - everything else (per config)"""
+        entry = self.entries.get(nodeid, {})
+        if config.failed_first and entry.get("last_outcome") == "failed":
+            return 0
+        if smoke is None:
+            smoke = entry.get("smoke", False)
+        if config.smoke_first and smoke:
+            return 1
+        return 2
+    
+    def schedule_order(self, nodeids: List[str]) -> List[int]:
+        """
+        Indexes of `nodeids` in the order to hand them out: priority groups first,
+        longest expected duration first within each group (LPT)
+        """
+        typical = self.typical_duration()
+        return sorted(
+            range(len(nodeids)),
+            key=lambda index: (self.priority(nodeids[index]),
+                               -self.expected_duration(nodeids[index], typical))
+        )
+
+
+# Create a single instance for easy import
+duration_history = DurationHistory()
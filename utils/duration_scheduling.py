@@ -0,0 +1,97 @@
+"""
+duration_scheduling.py - xdist scheduler that hands out the longest tests first
+Idle workers pull the next test from a queue ordered by priority group and then
+by expected duration (longest-processing-time-first), which keeps the slowest
+tests from landing at the end of the run on one worker
+
+Under --dist loadgroup every xdist_group is sent to one worker as a whole, when its
+first test comes up in the queue
+
+Only imported when pytest-xdist is running the session
+"""
+
+from typing import Optional
+from xdist.scheduler import LoadScheduling
+from utils.duration_history import duration_history
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling with a duration-ordered queue and a shallow per-worker backlog"""
+    
+    # Tests assigned to a worker at a time, the running one included (xdist needs
+    # two to start); kept small so the queue order decides what runs next
+    PREFETCH = 2
+    
+    def __init__(self, config, log=None):
+        super().__init__(config, log)
+        # Node ids only carry an "@group" suffix under --dist loadgroup
+        self.loadgroup = config.getvalue("dist") == "loadgroup"
+    
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        
+        # Initial distribution already happened, top up every node (e.g. a new worker)
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = duration_history.schedule_order(self.collection)
+        if not self.collection:
+            return
+        
+        # Deal one test per node per round so the longest tests land on different nodes
+        for _ in range(self.PREFETCH):
+            for node in self.nodes:
+                if self.pending:
+                    self._send_tests(node, 1)
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+    
+    def check_schedule(self, node, duration: float = 0) -> None:
+        """Keep PREFETCH tests queued on the node, shutting it down once the queue is empty"""
+        if node.shutting_down:
+            return
+        
+        if self.pending:
+            missing = self.PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        
+        self.log("num items waiting for node:", len(self.pending))
+    
+    def _send_tests(self, node, num: int) -> None:
+        """Send the next `num` queued tests, each together with the rest of its xdist_group"""
+        batch = []
+        for index in self.pending[:num]:
+            if index in batch:
+                continue
+            group = self._group(self.collection[index])
+            if group is None:
+                batch.append(index)
+                continue
+            # Group members run in collection order, so shared setup is reused
+            batch.extend(sorted(other for other in self.pending if self._group(self.collection[other]) == group))
+        if not batch:
+            return
+        for index in batch:
+            self.pending.remove(index)
+        self.node2pending[node].extend(batch)
+        node.send_runtest_some(batch)
+    
+    def _group(self, nodeid: str) -> Optional[str]:
+        """
+        xdist_group name that --dist loadgroup appends to the node id ("...@group")
+        Like xdist, an "@" inside the parameter brackets ("test[user@example.com]") is not a group
+        """
+        if not self.loadgroup or nodeid.rfind("@") <= nodeid.rfind("]"):
+            return None
+        return nodeid.rsplit("@", 1)[1]
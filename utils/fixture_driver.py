@@ -0,0 +1,35 @@
+"""
+fixture_driver.py - Browsers as the test fixtures get them
+create_driver()/attach_driver() plus everything the suite layers on top of a
+session: command timing, the hang watchdog and network interception.
+Used by tests/conftest.py and by the driver benchmarks, so startup is measured
+with the same overhead the tests pay
+"""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.driver_factory import create_driver, attach_driver
+from utils.command_timing import command_timer
+from utils.hang_watchdog import hang_watchdog
+from utils.network_interceptor import NetworkInterceptor
+from pages.base_page import BasePage
+
+
+def launch_driver() -> WebDriver:
+    """Create a timed browser with network interception installed"""
+    with command_timer.timing("driver_startup"):
+        driver = create_driver()
+    return instrument(driver)
+
+
+def attach_session(address: str) -> WebDriver:
+    """Attach a timed session to the shared browser (contexts mode)"""
+    with command_timer.timing("driver_startup"):
+        driver = attach_driver(address)
+    return instrument(driver)
+
+
+def instrument(driver: WebDriver) -> WebDriver:
+    command_timer.instrument(driver)
+    hang_watchdog.instrument(driver)
+    NetworkInterceptor(driver, BasePage.all_required_resources()).install()
+    return driver
@@ -0,0 +1,120 @@
+"""
+flow_runner.py - Runs end-to-end flows that share step prefixes only once
+Flows are declared as lists of named steps and stored in a prefix tree. The first
+flow through a shared prefix runs its steps and snapshots the browser state
+(cookies, web storage, URL) where flows branch off; every later flow restores the
+deepest snapshot on its path and only runs the steps after it. Each flow is still
+its own pytest test, parametrized over FlowTrie.names()
+
+Only state the snapshot can carry survives a fork: a step whose effect lives in
+the DOM alone (e.g. typed but unsubmitted form fields) must be declared with
+restorable=False, and no snapshot is taken right after it. A snapshot whose cookies
+are about to expire is dropped and taken again by the next flow through it
+
+Prefixes are shared per process: run under xdist with --dist loadgroup so the
+flows of an xdist_group stay on one worker (see utils/duration_scheduling.py)
+"""
+
+from typing import Callable, Dict, List, Optional
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.session_snapshot import capture, expiring, restore
+
+
+class Step:
+    """One named user action - steps with the same name must do the same thing"""
+    
+    def __init__(self, name: str, action: Callable[[WebDriver], object], restorable: bool = True):
+        self.name = name
+        self.action = action
+        self.restorable = restorable
+    
+    def __repr__(self) -> str:
+        return f"Step({self.name!r})"
+
+
+class _Node:
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.flows = 0
+        self.snapshot: Optional[Dict] = None
+
+
+class FlowTrie:
+    """Declared flows of one test module, with the snapshots of their shared prefixes"""
+    
+    def __init__(self):
+        self._root = _Node()
+        self._flows: Dict[str, List[Step]] = {}
+        self._checks: Dict[str, Callable[[WebDriver], None]] = {}
+    
+    def add(self, name: str, steps: List[Step], check: Callable[[WebDriver], None]) -> None:
+        """Declare a flow: `steps` drive the browser, then `check` asserts on the result"""
+        if name in self._flows:
+            raise ValueError(f"Flow '{name}' declared twice")
+        self._flows[name] = list(steps)
+        self._checks[name] = check
+        node = self._root
+        for step in steps:
+            node = node.children.setdefault(step.name, _Node())
+            node.flows += 1
+    
+    def names(self) -> List[str]:
+        return list(self._flows)
+    
+    def run(self, driver: WebDriver, name: str) -> Dict[str, int]:
+        """
+        Bring a clean browser to the end of the flow, resuming from the deepest
+        snapshot on its path, then run its check
+        Returns {"ran": steps executed, "total": steps in the flow}
+        """
+        steps = self._flows[name]
+        path = []
+        node = self._root
+        for step in steps:
+            node = node.children[step.name]
+            path.append(node)
+        
+        start = 0
+        for index, node in enumerate(path):
+            if node.snapshot is not None and expiring(node.snapshot):
+                # The session cookie is about to expire - take this snapshot again
+                node.snapshot = None
+            if node.snapshot is not None:
+                start = index + 1
+        if start:
+            restore(driver, path[start - 1].snapshot)
+        
+        for index in range(start, len(steps)):
+            steps[index].action(driver)
+            node = path[index]
+            # Snapshot where flows branch off, so the other branches can resume here
+            if node.flows > 1 and steps[index].restorable and node.snapshot is None:
+                node.snapshot = capture(driver)
+        
+        self._checks[name](driver)
+        return {"ran": len(steps) - start, "total": len(steps)}
+
+
+class FlowSummary:
+    """Steps run versus steps declared, collected on the controller"""
+    
+    def __init__(self):
+        self.flows = 0
+        self.ran = 0
+        self.total = 0
+    
+    def add_test(self, result: Optional[Dict[str, int]]) -> None:
+        if result:
+            self.flows += 1
+            self.ran += result["ran"]
+            self.total += result["total"]
+    
+    def summary_lines(self) -> List[str]:
+        if not self.flows:
+            return []
+        saved = f", {self.total / self.ran:.1f}x fewer" if self.ran else ""
+        return [f"{self.flows} flows ran {self.ran} of {self.total} declared steps{saved}"]
+
+
+# Create a single instance for easy import
+flow_summary = FlowSummary()
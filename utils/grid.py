@@ -0,0 +1,129 @@
+"""
+grid.py - Runs browsers on a Selenium Grid instead of this machine
+Used when [grid] hub_url is set. Every session of a process shares one keep-alive
+connection pool to the hub, and the hub's /status endpoint tells how many browser
+slots its nodes offer, which sizes `pytest -n auto` so every slot is kept busy.
+The hub spreads new sessions over the nodes with the most free slots
+"""
+
+import json
+import logging
+import threading
+import urllib.request
+from typing import Dict, Optional
+import urllib3
+from selenium.webdriver import Remote
+from selenium.webdriver.common.options import BaseOptions
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+
+logger = logging.getLogger(__name__)
+
+# browserName in the node stereotypes for each configured browser
+BROWSER_NAMES = {"chrome": "chrome", "firefox": "firefox", "edge": "MicrosoftEdge"}
+
+CONNECT_TIMEOUT = 10
+STATUS_TIMEOUT = 10
+
+
+class GridConnection(RemoteConnection):
+    """Keep-alive connection to the hub with room for concurrent requests"""
+    
+    # Test thread, pre-spawner and teardown may talk to the hub at the same time;
+    # urllib3 keeps a single socket per host by default and drops the rest
+    POOL_MAXSIZE = 4
+    
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw["maxsize"] = self.POOL_MAXSIZE
+        # A hung remote browser can't be killed from here - bound each command
+        # by the watchdog's command timeout instead
+        if config.watchdog_enabled:
+            manager.connection_pool_kw["timeout"] = urllib3.Timeout(
+                connect=CONNECT_TIMEOUT, read=config.watchdog_command_timeout
+            )
+        return manager
+    
+    def close(self) -> None:
+        """
+        WebDriver.quit() closes its connection - keep the shared sockets open for the
+        other sessions; shutdown() releases them at session end
+        """
+    
+    def shutdown(self) -> None:
+        super().close()
+
+
+_connection: Optional[GridConnection] = None
+_connection_lock = threading.Lock()
+
+
+def connection() -> GridConnection:
+    """The hub connection shared by every session of this process"""
+    global _connection
+    with _connection_lock:
+        if _connection is None:
+            _connection = GridConnection(config.grid_hub_url.rstrip("/"), keep_alive=True)
+        return _connection
+
+
+def close_connection() -> None:
+    """Release the shared hub connection (end of the pytest session)"""
+    global _connection
+    with _connection_lock:
+        if _connection is not None:
+            _connection.shutdown()
+            _connection = None
+
+
+def launch(options: BaseOptions, fast: bool) -> WebDriver:
+    """Start a session on the Grid with the given browser options"""
+    driver = Remote(command_executor=connection(), options=options)
+    if not fast:
+        driver.maximize_window()
+    return driver
+
+
+# =============== CAPACITY ===============
+
+def fetch_status(hub_url: str) -> Dict:
+    """The hub's /status document (value part)"""
+    with urllib.request.urlopen(f"{hub_url.rstrip('/')}/status", timeout=STATUS_TIMEOUT) as response:
+        return json.load(response)["value"]
+
+
+def node_slots(status: Dict, browser: str) -> Dict[str, int]:
+    """Slots for `browser` on each node that is up, keyed by node URI"""
+    browser_name = BROWSER_NAMES.get(browser, browser)
+    slots = {}
+    for node in status.get("nodes", []):
+        if node.get("availability") != "UP":
+            continue
+        count = sum(1 for slot in node.get("slots", [])
+                    if slot.get("stereotype", {}).get("browserName") == browser_name)
+        if count:
+            # A node never runs more sessions than maxSessions, whatever its slots say
+            slots[node.get("uri", node.get("id"))] = min(count, node.get("maxSessions", count))
+    return slots
+
+
+def sessions_per_worker() -> int:
+    """Browser sessions one xdist worker holds at once"""
+    if config.driver_mode == "isolated":
+        # The running test's browser plus the pre-spawned ones
+        return 1 + config.prespawn_size
+    return max(1, config.pool_size)
+
+
+def worker_count() -> Optional[int]:
+    """Workers that fill the Grid's slots for the configured browser, or None without a reachable hub"""
+    try:
+        slots = node_slots(fetch_status(config.grid_hub_url), config.browser)
+    except (OSError, ValueError, KeyError):
+        logger.exception("Could not read the Grid status from %s", config.grid_hub_url)
+        return None
+    total = sum(slots.values())
+    logger.info("Grid %s: %d %s slots on %d nodes %s", config.grid_hub_url, total, config.browser,
+                len(slots), slots)
+    return max(1, total // sessions_per_worker()) if total else None
@@ -0,0 +1,190 @@
+"""
+hang_watchdog.py - Kills browsers that stop answering
+One background thread tracks every in-flight WebDriver command and the browser of
+the running test. A command running past command_timeout, or a test past
+test_timeout, gets its browser process tree killed, which makes the blocked call
+fail at once. Diagnostics (thread stacks, process tree) are written to reports/hangs/
+and the fixture swaps in a fresh browser for the next test
+
+Sessions without a local driver process (Selenium Grid) are ended on the hub with
+DELETE /session/{id} instead. In contexts mode only the worker's own chromedriver is
+killed, never the shared browser. Browser launches are not watched - a session is
+tracked from its first command after create_driver() returns
+"""
+
+import itertools
+import logging
+import os
+import re
+import sys
+import threading
+import time
+import traceback
+import urllib.request
+import weakref
+from typing import Dict, List, Optional, Tuple
+import psutil
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+from utils import process_tree
+
+logger = logging.getLogger(__name__)
+
+HANGS_DIR = os.path.join("reports", "hangs")
+
+# Ending a hung remote session must not hang the watchdog itself
+REMOTE_DELETE_TIMEOUT = 10
+
+
+class HangWatchdog:
+    """Per-command and per-test deadlines for browser sessions"""
+    
+    CHECK_INTERVAL = 1.0
+    
+    def __init__(self, command_timeout: Optional[float] = None, test_timeout: Optional[float] = None):
+        self.command_timeout = command_timeout if command_timeout is not None else config.watchdog_command_timeout
+        self.test_timeout = test_timeout if test_timeout is not None else config.watchdog_test_timeout
+        self._tokens = itertools.count()
+        self._commands: Dict[int, Tuple[WebDriver, str, float]] = {}
+        self._test: Optional[Tuple[str, WebDriver, float]] = None
+        self._killed: "weakref.WeakKeyDictionary[WebDriver, str]" = weakref.WeakKeyDictionary()
+        self._reported: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return config.watchdog_enabled
+    
+    # =============== TRACKING ===============
+    
+    def instrument(self, driver: WebDriver) -> WebDriver:
+        """Wrap driver.execute on this instance so every command has a deadline"""
+        if not self.enabled:
+            return driver
+        self._ensure_started()
+        execute = driver.execute
+        
+        def watched_execute(driver_command, params=None):
+            token = next(self._tokens)
+            with self._lock:
+                self._commands[token] = (driver, driver_command, time.monotonic())
+            try:
+                return execute(driver_command, params)
+            finally:
+                with self._lock:
+                    self._commands.pop(token, None)
+        
+        driver.execute = watched_execute
+        return driver
+    
+    def watch_test(self, nodeid: str, driver: WebDriver) -> None:
+        """Start the per-test deadline for the browser a test is using"""
+        with self._lock:
+            self._test = (nodeid, driver, time.monotonic())
+    
+    def end_test(self) -> None:
+        with self._lock:
+            self._test = None
+    
+    def killed_reason(self, driver: WebDriver) -> Optional[str]:
+        """Why the watchdog killed this browser, or None if it is alive"""
+        return self._killed.get(driver)
+    
+    def add_report(self, nodeid: str, reason: Optional[str]) -> None:
+        """Keep a hang reported by a test for the session summary (controller side)"""
+        if reason:
+            self._reported[nodeid] = reason
+    
+    def summary_lines(self) -> List[str]:
+        return [f"{nodeid}: {reason}" for nodeid, reason in self._reported.items()]
+    
+    # =============== WATCHING ===============
+    
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="hang-watchdog", daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.CHECK_INTERVAL)
+            now = time.monotonic()
+            expired = []
+            with self._lock:
+                test_nodeid, test_driver = (self._test[0], self._test[1]) if self._test else (None, None)
+                for driver, command, started in self._commands.values():
+                    if now - started > self.command_timeout:
+                        nodeid = test_nodeid if driver is test_driver else None
+                        expired.append((driver, f"command '{command}' running for {now - started:.0f}s", nodeid))
+                if self._test and now - self._test[2] > self.test_timeout:
+                    expired.append((test_driver, f"test running for {now - self._test[2]:.0f}s", test_nodeid))
+                    self._test = None
+            for driver, reason, nodeid in expired:
+                if driver in self._killed:
+                    continue
+                try:
+                    self._kill(driver, reason, nodeid)
+                except Exception:
+                    # The watchdog itself must survive anything a dying browser throws at it
+                    logger.exception("Hang watchdog failed to handle %s", reason)
+    
+    def _kill(self, driver: WebDriver, reason: str, nodeid: Optional[str]) -> None:
+        logger.error("Browser hung (%s) - killing its process tree", reason)
+        path = self._write_diagnostics(driver, reason, nodeid)
+        self._killed[driver] = f"{reason}, diagnostics in {path}"
+        if process_tree.driver_process(driver) is None:
+            self._end_remote_session(driver)
+            return
+        try:
+            process_tree.kill_session(driver)
+        except psutil.Error:
+            logger.exception("Could not kill the hung browser")
+    
+    @staticmethod
+    def _end_remote_session(driver: WebDriver) -> None:
+        """
+        Delete a session that has no local process (Grid) on its server, over a fresh
+        connection - the session's own pooled connection is the one that is blocked
+        """
+        url = f"{driver.command_executor._url.rstrip('/')}/session/{driver.session_id}"
+        try:
+            urllib.request.urlopen(urllib.request.Request(url, method="DELETE"),
+                                   timeout=REMOTE_DELETE_TIMEOUT).close()
+        except OSError:
+            logger.exception("Could not end the hung remote session %s", driver.session_id)
+    
+    def _write_diagnostics(self, driver: WebDriver, reason: str, nodeid: Optional[str]) -> str:
+        """Thread stacks and the browser's process tree at the moment of the hang"""
+        lines = [f"reason: {reason}", f"test: {nodeid}", f"time: {time.strftime('%Y-%m-%dT%H:%M:%S')}", ""]
+        
+        lines.append("=== process tree ===")
+        process = process_tree.driver_process(driver)
+        for member in process_tree.tree(process) if process else []:
+            try:
+                lines.append(
+                    f"{member.pid:>7} {member.name():<24} {member.status():<10} "
+                    f"cpu {sum(member.cpu_times()[:2]):.1f}s rss {member.memory_info().rss / process_tree.MB:.0f} MB"
+                )
+            except psutil.Error:
+                continue
+        
+        lines.append("")
+        lines.append("=== python threads ===")
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            lines.append(f"--- {names.get(ident, ident)}")
+            lines.extend(line.rstrip() for line in traceback.format_stack(frame))
+        
+        os.makedirs(HANGS_DIR, exist_ok=True)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", (nodeid or "no-test").split("::")[-1])[:60]
+        path = os.path.join(HANGS_DIR, f"{worker}-{name}-{int(time.time())}.txt")
+        with open(path, "w") as handle:
+            handle.write("\n".join(lines) + "\n")
+        return path
+
+
+# Create a single instance for easy import
+hang_watchdog = HangWatchdog()
@@ -0,0 +1,272 @@
+"""
+network_interceptor.py - Blocks and stubs requests the tests never assert on
+Chromium browsers are driven through the DevTools protocol (execute_cdp_cmd);
+other browsers run unintercepted
+    
+    block   - Network.setBlockedURLs for the blocklist, in-page stubs for fetch/XHR
+    observe - nothing blocked, only resource sizes are recorded
+    off     - no interception at all
+
+Bytes saved are estimated from a size table learned whenever a resource does load
+(for example in observe mode) and persisted between runs
+"""
+
+import json
+import logging
+import mimetypes
+import os
+import weakref
+from fnmatch import fnmatch
+from typing import Dict, Iterable, List
+from filelock import FileLock
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Overrides fetch/XHR for stubbed URL globs; counts are kept in sessionStorage
+# so they survive page transitions within the test
+STUB_SCRIPT_TEMPLATE = """
+(function () {
+    var stubs = %s;
+    var STATS_KEY = "__network_stubs";
+    function globToRegExp(glob) {
+        return new RegExp("^" + glob.replace(/[.+^${}()|[\\]\\\\?]/g, "\\\\$&").replace(/\\*/g, ".*") + "$");
+    }
+    stubs.forEach(function (stub) { stub.regex = globToRegExp(stub.pattern); });
+    function match(url) {
+        var absolute = new URL(url, window.location.href).href;
+        for (var i = 0; i < stubs.length; i++) {
+            if (stubs[i].regex.test(absolute)) { return stubs[i]; }
+        }
+        return null;
+    }
+    function count(stub) {
+        var stats = JSON.parse(window.sessionStorage.getItem(STATS_KEY) || '{"requests": 0, "bytes": 0}');
+        stats.requests += 1;
+        stats.bytes += stub.body.length;
+        window.sessionStorage.setItem(STATS_KEY, JSON.stringify(stats));
+    }
+    var originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+        var stub = match(typeof input === "string" ? input : input.url);
+        if (!stub) { return originalFetch.apply(this, arguments); }
+        count(stub);
+        return Promise.resolve(new Response(stub.body, {status: 200, headers: {"Content-Type": stub.contentType}}));
+    };
+    var originalOpen = XMLHttpRequest.prototype.open;
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__stub = match(url);
+        return originalOpen.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function () {
+        var stub = this.__stub;
+        if (!stub) { return originalSend.apply(this, arguments); }
+        count(stub);
+        var xhr = this;
+        Object.defineProperty(xhr, "readyState", {value: 4});
+        Object.defineProperty(xhr, "status", {value: 200});
+        Object.defineProperty(xhr, "responseText", {value: stub.body});
+        Object.defineProperty(xhr, "response", {value: stub.body});
+        setTimeout(function () {
+            xhr.dispatchEvent(new Event("readystatechange"));
+            xhr.dispatchEvent(new Event("load"));
+            xhr.dispatchEvent(new Event("loadend"));
+        }, 0);
+    };
+})();
+"""
+
+STUB_STATS_JS = """
+var stats = window.sessionStorage.getItem("__network_stubs");
+window.sessionStorage.removeItem("__network_stubs");
+return stats ? JSON.parse(stats) : {requests: 0, bytes: 0};
+"""
+
+_interceptors: "weakref.WeakKeyDictionary[WebDriver, NetworkInterceptor]" = weakref.WeakKeyDictionary()
+
+
+def effective_blocklist(blocklist: Iterable[str], required_resources: Iterable[str]) -> List[str]:
+    """Drop block patterns that would match a resource a page object declared as required"""
+    required = list(required_resources)
+    return [
+        pattern for pattern in blocklist
+        if not any(fnmatch(resource, pattern) for resource in required)
+    ]
+
+
+class NetworkInterceptor:
+    """Per-driver request blocking, fetch/XHR stubbing and traffic accounting"""
+    
+    def __init__(self, driver: WebDriver, required_resources: Iterable[str] = ()):
+        self.driver = driver
+        self.mode = config.network_interception
+        self.blocklist = effective_blocklist(config.network_blocklist, required_resources)
+        self.stubs = config.network_stubs
+        self.supported = hasattr(driver, "execute_cdp_cmd")
+        self._urls: Dict[str, str] = {}
+        _interceptors[driver] = self
+    
+    @classmethod
+    def for_driver(cls, driver: WebDriver):
+        """Interceptor installed on a driver, or None"""
+        return _interceptors.get(driver)
+    
+    def install(self) -> None:
+        """Enable interception for the lifetime of the browser session"""
+        if self.mode == "off":
+            return
+        if not self.supported:
+            logger.info("Network interception needs a Chromium browser - running without it")
+            return
+        
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        if self.mode != "block":
+            return
+        if self.blocklist:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocklist})
+        if self.stubs:
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": self._stub_script()}
+            )
+    
+    def begin_test(self) -> None:
+        """Discard traffic from before the test (e.g. the pool reset navigation)"""
+        if self.mode != "off" and self.supported:
+            self._drain_performance_log()
+    
+    def collect(self) -> Dict[str, int]:
+        """Traffic for the current test: requests/bytes loaded, blocked, stubbed and saved"""
+        stats = {"requests": 0, "bytes": 0, "blocked": 0, "stubbed": 0, "bytes_saved": 0}
+        if self.mode == "off" or not self.supported:
+            return stats
+        
+        sizes = resource_sizes.load()
+        for url, outcome, size in self._drain_performance_log():
+            if outcome == "blocked":
+                stats["blocked"] += 1
+                stats["bytes_saved"] += sizes.get(url, 0)
+            else:
+                stats["requests"] += 1
+                stats["bytes"] += size
+                resource_sizes.learn(url, size)
+        
+        if self.stubs:
+            try:
+                stubbed = self.driver.execute_script(STUB_STATS_JS)
+                stats["stubbed"] = stubbed["requests"]
+                stats["bytes_saved"] += stubbed["bytes"]
+            except WebDriverException:
+                pass
+        return stats
+    
+    def _drain_performance_log(self) -> List:
+        """Turn Chrome performance log events into (url, outcome, encoded bytes)"""
+        results = []
+        try:
+            entries = self.driver.get_log("performance")
+        except WebDriverException:
+            return results
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                self._urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFinished":
+                url = self._urls.pop(params["requestId"], None)
+                if url:
+                    results.append((url, "loaded", int(params.get("encodedDataLength", 0))))
+            elif method == "Network.loadingFailed":
+                url = self._urls.pop(params["requestId"], None)
+                if url and params.get("blockedReason"):
+                    results.append((url, "blocked", 0))
+        return results
+    
+    def _stub_script(self) -> str:
+        stubs = []
+        for pattern, path in self.stubs.items():
+            with open(os.path.join(PROJECT_ROOT, path)) as stub_file:
+                body = stub_file.read()
+            content_type = mimetypes.guess_type(path)[0] or "text/plain"
+            stubs.append({"pattern": pattern, "body": body, "contentType": content_type})
+        return STUB_SCRIPT_TEMPLATE % json.dumps(stubs)
+
+
+class ResourceSizeTable:
+    """Encoded sizes of resources seen loading, persisted to estimate savings"""
+    
+    def __init__(self):
+        self.path = os.path.join(PROJECT_ROOT, config.network_size_table)
+        self._sizes = None
+        self._learned: Dict[str, int] = {}
+    
+    def load(self) -> Dict[str, int]:
+        if self._sizes is None:
+            try:
+                with open(self.path) as table:
+                    self._sizes = json.load(table)
+            except (OSError, ValueError):
+                self._sizes = {}
+        return self._sizes
+    
+    def learn(self, url: str, size: int) -> None:
+        if size:
+            self.load()[url] = size
+            self._learned[url] = size
+    
+    def save(self) -> None:
+        """Merge sizes learned by this process into the shared table"""
+        if not self._learned:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with FileLock(self.path + ".lock"):
+            try:
+                with open(self.path) as table:
+                    sizes = json.load(table)
+            except (OSError, ValueError):
+                sizes = {}
+            sizes.update(self._learned)
+            with open(self.path, "w") as table:
+                json.dump(sizes, table, indent=2)
+        self._learned = {}
+
+
+class TrafficSummary:
+    """Per-test traffic stats collected for the end-of-session report"""
+    
+    def __init__(self):
+        self._tests: Dict[str, Dict[str, int]] = {}
+    
+    def add_test(self, nodeid: str, stats: Dict[str, int]) -> None:
+        if stats:
+            self._tests[nodeid] = stats
+    
+    def summary_lines(self) -> List[str]:
+        """One line per test that blocked or stubbed anything, plus session totals"""
+        lines = []
+        totals = {"blocked": 0, "stubbed": 0, "bytes_saved": 0}
+        for nodeid, stats in self._tests.items():
+            if not (stats["blocked"] or stats["stubbed"]):
+                continue
+            for key in totals:
+                totals[key] += stats[key]
+            lines.append(
+                f"{nodeid}: {stats['blocked']} blocked, {stats['stubbed']} stubbed, "
+                f"~{stats['bytes_saved'] / 1024:.1f} KiB saved "
+                f"({stats['requests']} requests / {stats['bytes'] / 1024:.1f} KiB loaded)"
+            )
+        if lines:
+            lines.append(
+                f"total: {totals['blocked']} blocked, {totals['stubbed']} stubbed, "
+                f"~{totals['bytes_saved'] / 1024:.1f} KiB saved"
+            )
+        return lines
+
+
+# Create single instances for easy import
+resource_sizes = ResourceSizeTable()
+traffic_summary = TrafficSummary()
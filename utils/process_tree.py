@@ -0,0 +1,71 @@
+"""
+process_tree.py - Memory and lifetime of the processes behind a browser session
+A local WebDriver session is a driver executable (chromedriver, geckodriver, ...)
+plus the browser processes it launched, all descendants of the test process
+"""
+
+import os
+from typing import List, Optional
+import psutil
+from selenium.webdriver.remote.webdriver import WebDriver
+
+MB = 1024 * 1024
+
+
+def driver_process(driver: WebDriver) -> Optional[psutil.Process]:
+    """Driver executable process of a local session (None for remote sessions)"""
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if process is None:
+        return None
+    try:
+        return psutil.Process(process.pid)
+    except psutil.NoSuchProcess:
+        return None
+
+
+def tree(root: psutil.Process) -> List[psutil.Process]:
+    """The process and all of its descendants that are still alive"""
+    try:
+        return [root] + root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def rss_mb(processes: List[psutil.Process]) -> float:
+    """Combined resident memory in MB, skipping processes that exited meanwhile"""
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total / MB
+
+
+def session_rss_mb(driver: WebDriver) -> float:
+    """Memory held by one browser session (driver executable + browser processes)"""
+    process = driver_process(driver)
+    return rss_mb(tree(process)) if process else 0.0
+
+
+def browsers_rss_mb() -> float:
+    """Memory held by every browser session launched from this process"""
+    try:
+        return rss_mb(psutil.Process(os.getpid()).children(recursive=True))
+    except psutil.NoSuchProcess:
+        return 0.0
+
+
+def kill_session(driver: WebDriver) -> None:
+    """Kill a session's whole process tree, for browsers that no longer answer quit()"""
+    process = driver_process(driver)
+    if process is None:
+        return
+    processes = tree(process)
+    for member in processes:
+        try:
+            member.kill()
+        except psutil.NoSuchProcess:
+            continue
+    psutil.wait_procs(processes, timeout=5)
@@ -0,0 +1,177 @@
+"""
+session_snapshot.py - Runs a test precondition once and replays its browser state
+After a named precondition (login, cart contents, ...) has run, the cookies,
+localStorage, sessionStorage and URL it left behind are captured. Later tests
+get that state written into their clean browser and reach the URL with a
+single navigation instead of repeating the steps
+
+Snapshots are cached per xdist worker, in memory and under [snapshots] cache_dir,
+and are discarded when the base URL, credentials, browser or profile, the page
+objects or the precondition change, or when one of their cookies is about to expire
+"""
+
+import glob
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+from selenium.webdriver.remote.webdriver import WebDriver
+from utils.config_reader import config
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A snapshot whose cookies expire within this many seconds is taken again
+EXPIRY_MARGIN = 60
+
+CAPTURE_STORAGE_JS = """
+const dump = (storage) => {
+    const entries = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        entries[key] = storage.getItem(key);
+    }
+    return entries;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+RESTORE_STORAGE_JS = """
+for (const [key, value] of Object.entries(arguments[0])) { window.localStorage.setItem(key, value); }
+for (const [key, value] of Object.entries(arguments[1])) { window.sessionStorage.setItem(key, value); }
+"""
+
+
+def capture(driver: WebDriver) -> Dict:
+    """Cookies, web storage and URL of the current page"""
+    storage = driver.execute_script(CAPTURE_STORAGE_JS)
+    return {
+        "url": driver.current_url,
+        "cookies": driver.get_cookies(),
+        "local": storage["local"],
+        "session": storage["session"],
+        "taken_at": time.time(),
+    }
+
+
+def expiring(snapshot: Dict) -> bool:
+    """Whether one of the snapshot's cookies expires within EXPIRY_MARGIN"""
+    deadline = time.time() + EXPIRY_MARGIN
+    return any("expiry" in cookie and cookie["expiry"] < deadline for cookie in snapshot["cookies"])
+
+
+def restore(driver: WebDriver, snapshot: Dict) -> None:
+    """
+    Write a snapshot into a browser with clean state and navigate to its URL
+    The browser must be on the snapshot's origin (pool reset and pre-spawned
+    browsers are on the base URL), otherwise the origin is loaded first
+    """
+    current, target = urlsplit(driver.current_url), urlsplit(snapshot["url"])
+    if (current.scheme, current.netloc) != (target.scheme, target.netloc):
+        driver.get(f"{target.scheme}://{target.netloc}/")
+    
+    for cookie in snapshot["cookies"]:
+        # Let the browser scope the cookie to the current host - explicit
+        # domains like "localhost" are rejected by some drivers
+        driver.add_cookie({key: value for key, value in cookie.items() if key != "domain"})
+    driver.execute_script(RESTORE_STORAGE_JS, snapshot["local"], snapshot["session"])
+    driver.get(snapshot["url"])
+
+
+class SnapshotCache:
+    """Named precondition snapshots of one worker"""
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = os.path.join(PROJECT_ROOT, cache_dir or config.snapshot_cache_dir)
+        self._snapshots: Dict[str, Dict] = {}
+        self._pages_hash: Optional[str] = None
+    
+    @property
+    def enabled(self) -> bool:
+        return config.snapshots_enabled
+    
+    def apply(self, driver: WebDriver, name: str, precondition: Callable[[WebDriver], None]) -> None:
+        """
+        Bring the browser into the state `precondition` produces: restore the
+        cached snapshot if there is a valid one, otherwise run the precondition
+        and snapshot its result for the next test
+        """
+        if not self.enabled:
+            precondition(driver)
+            return
+        
+        key = self._key(precondition)
+        snapshot = self._lookup(name, key)
+        if snapshot is not None:
+            restore(driver, snapshot)
+            return
+        
+        precondition(driver)
+        snapshot = capture(driver)
+        snapshot["key"] = key
+        self._store(name, snapshot)
+        logger.info("Captured snapshot '%s' at %s", name, snapshot["url"])
+    
+    def invalidate(self, name: str) -> None:
+        """Forget a snapshot, e.g. when a test found the restored state unusable"""
+        self._snapshots.pop(name, None)
+        try:
+            os.remove(self._path(name))
+        except OSError:
+            pass
+    
+    # =============== CACHE ===============
+    
+    def _key(self, precondition: Callable) -> str:
+        """
+        What a snapshot depends on: the config a precondition reads (base URL,
+        credentials, browser and profile), page-object code and the precondition itself
+        """
+        if self._pages_hash is None:
+            digest = hashlib.sha1()
+            for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, "pages", "*.py"))):
+                with open(path, "rb") as handle:
+                    digest.update(handle.read())
+            self._pages_hash = digest.hexdigest()
+        try:
+            source = inspect.getsource(precondition)
+        except (OSError, TypeError):
+            source = getattr(precondition, "__qualname__", repr(precondition))
+        settings = [config.base_url, config.valid_username, config.valid_password, config.browser, config.profile]
+        return hashlib.sha1("\n".join(settings + [self._pages_hash, source]).encode()).hexdigest()
+    
+    def _lookup(self, name: str, key: str) -> Optional[Dict]:
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            try:
+                with open(self._path(name)) as handle:
+                    snapshot = json.load(handle)
+            except (OSError, ValueError):
+                return None
+        if snapshot.get("key") != key or expiring(snapshot):
+            self.invalidate(name)
+            return None
+        self._snapshots[name] = snapshot
+        return snapshot
+    
+    def _store(self, name: str, snapshot: Dict) -> None:
+        self._snapshots[name] = snapshot
+        os.makedirs(os.path.dirname(self._path(name)), exist_ok=True)
+        temp_path = f"{self._path(name)}.tmp"
+        with open(temp_path, "w") as handle:
+            json.dump(snapshot, handle, indent=2)
+        os.replace(temp_path, self._path(name))
+    
+    def _path(self, name: str) -> str:
+        safe_name = "".join(char if char.isalnum() or char in "-_." else "_" for char in name)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(self.cache_dir, worker, f"{safe_name}.json")
+
+
+# Create a single instance for easy import
+snapshot_cache = SnapshotCache()
@@ -0,0 +1,75 @@
+"""
+step_retry.py - Retries a single page-object action after a transient failure
+A stale element or a click landing on an overlay is retried in place - the
+element is located again and the action repeated after a short backoff - instead
+of failing the test and paying for a rerun with a fresh login. Every retry is
+recorded so flaky steps stay visible in the report
+"""
+
+import time
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, StaleElementReferenceException
+)
+from utils.call_context import page_object_caller
+from utils.config_reader import config
+
+T = TypeVar("T")
+
+# The element was replaced by a re-render, or is covered / not yet interactable
+# (animations, overlays). Timeouts and missing elements are real failures
+RETRYABLE = (StaleElementReferenceException, ElementClickInterceptedException, ElementNotInteractableException)
+
+
+class StepRetry:
+    """Bounded retry of single steps, collecting the retries of the running test"""
+    
+    def __init__(self, attempts: Optional[int] = None, backoff: Optional[float] = None):
+        self.attempts = attempts if attempts is not None else config.step_attempts
+        self.backoff = backoff if backoff is not None else config.step_backoff
+        self._events: List[Dict] = []
+        self._tests: Dict[str, List[Dict]] = {}
+    
+    def run(self, action: Callable[[], T], locator: Optional[Tuple[str, str]] = None) -> T:
+        """
+        Call `action` (which must locate its element itself) up to `attempts` times,
+        sleeping backoff, 2 x backoff, ... between attempts
+        """
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return action()
+            except RETRYABLE as error:
+                if attempt == self.attempts:
+                    raise
+                self._events.append({
+                    "caller": page_object_caller() or "<test code>",
+                    "locator": f"{locator[0]}={locator[1]}" if locator else "<action>",
+                    "error": type(error).__name__,
+                    "attempt": attempt,
+                })
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+    
+    def drain(self) -> List[Dict]:
+        """Return and clear the retries recorded since the last drain"""
+        events, self._events = self._events, []
+        return events
+    
+    def add_test(self, nodeid: str, events: Optional[List[Dict]]) -> None:
+        """Keep a test's retries (from any phase) for the session summary (controller side)"""
+        if events:
+            self._tests.setdefault(nodeid, []).extend(events)
+    
+    @staticmethod
+    def describe(event: Dict) -> str:
+        return f"{event['caller']} retried {event['locator']} after {event['error']} (attempt {event['attempt']})"
+    
+    def summary_lines(self) -> List[str]:
+        lines = []
+        for nodeid, events in self._tests.items():
+            lines.append(nodeid)
+            lines.extend(f"    {self.describe(event)}" for event in events)
+        return lines
+
+
+# Create a single instance for easy import
+step_retry = StepRetry()
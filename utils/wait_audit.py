@@ -0,0 +1,53 @@
+"""
+wait_audit.py - Records explicit waits that ran into their timeout
+A timeout inside a passing test means a page object paid the full wait for nothing
+"""
+
+from typing import Dict, List, Tuple
+from utils.call_context import page_object_caller
+from utils.config_reader import config
+
+
+class WaitAudit:
+    """Collects wait timeouts for the running test and summarises passing tests"""
+    
+    def __init__(self):
+        self._events: List[Dict] = []
+        self._passed: Dict[str, List[Dict]] = {}
+    
+    @property
+    def enabled(self) -> bool:
+        return config.wait_audit
+    
+    def record(self, locator: Tuple[str, str], timeout: float) -> None:
+        """Note a timed-out wait, attributed to the calling page-object method"""
+        if not self.enabled:
+            return
+        self._events.append({
+            "caller": page_object_caller() or "<test code>",
+            "locator": f"{locator[0]}={locator[1]}" if locator else "<condition>",
+            "timeout": timeout,
+        })
+    
+    def drain(self) -> List[Dict]:
+        """Return and clear the timeouts recorded since the last drain"""
+        events, self._events = self._events, []
+        return events
+    
+    def add_passed_test(self, nodeid: str, events: List[Dict]) -> None:
+        """Keep the timeouts of a passing test for the session summary"""
+        if events:
+            self._passed[nodeid] = events
+    
+    def summary_lines(self) -> List[str]:
+        """Human readable report of timeouts hit on the happy path"""
+        lines = []
+        for nodeid, events in self._passed.items():
+            lines.append(nodeid)
+            for event in events:
+                lines.append(f"    {event['caller']} waited {event['timeout']}s for {event['locator']}")
+        return lines
+
+
+# Create a single instance for easy import
+wait_audit = WaitAudit()
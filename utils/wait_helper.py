@@ -1,52 +1,200 @@
 """
 wait_helper.py - Provides reusable explicit wait methods
 Reduces flaky tests by properly waiting for elements
+
+Two wait engines ([settings] wait_engine):
+    event - one execute_async_script call per wait; a MutationObserver in the page
+            re-checks the condition on every DOM change and returns as soon as it holds
+    poll  - find/check round trips with adaptive backoff (also the fallback for a
+            wait the page can't run the wait script for)
 """
 
-from selenium.webdriver.support.ui import WebDriverWait
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, TimeoutException
+)
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
-from typing import List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from utils.config_reader import config
+from utils.dom_scripts import WAIT_FOR_JS
+from utils.wait_audit import wait_audit
 
 
 class WaitHelper:
     """Helper class for explicit waits"""
     
+    DEFAULT_POLL = 0.5
+    MIN_POLL = 0.05
+    BACKOFF = 1.5
+    
+    # Longest single async wait - must stay below the driver's script timeout
+    MAX_SCRIPT_WAIT = 20
+    
     def __init__(self, driver: WebDriver):
         self.driver = driver
         self.timeout = config.explicit_wait
-        self.wait = WebDriverWait(driver, self.timeout)
+        self.engine = config.wait_engine
+    
+    def _until(self, condition: Callable, locator: Optional[Tuple[str, str]] = None,
+               timeout: Optional[float] = None, spec: Optional[Dict] = None, no_implicit: bool = False):
+        """
+        Run a wait, recording it in the wait audit if it times out
+        `spec` describes the condition for the in-page event engine; without it
+        (or when the page can't run the wait script) `condition` is polled.
+        `no_implicit` suspends the implicit wait while polling - for conditions
+        whose finds are expected to come back empty
+        """
+        if timeout is None:
+            timeout = self.timeout
+        try:
+            if spec is not None and self.engine == "event":
+                return self._wait_for_event(condition, spec, timeout, no_implicit)
+            return self._poll(condition, timeout, no_implicit)
+        except TimeoutException:
+            wait_audit.record(locator, timeout)
+            raise
+    
+    def _wait_for_event(self, condition: Callable, spec: Dict, timeout: float, no_implicit: bool):
+        """Block in a single async script until the page reports the condition holds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Condition {spec} not met within {timeout}s")
+            chunk = min(remaining, self.MAX_SCRIPT_WAIT)
+            try:
+                result = self.driver.execute_async_script(WAIT_FOR_JS, spec, int(chunk * 1000))
+            except JavascriptException as error:
+                # A navigation unloads the document the script was waiting in -
+                # install the observer again in the new page
+                if "unload" in str(error.msg).lower():
+                    continue
+                # This wait can't run in the page - poll it; the next wait tries the script again
+                return self._poll(condition, remaining, no_implicit)
+            
+            if result is None:
+                continue
+            if isinstance(result, dict) and "waitError" in result:
+                return self._poll(condition, remaining, no_implicit)
+            return result
+    
+    def _poll(self, condition: Callable, timeout: float, no_implicit: bool = False):
+        """Check the condition from Python, backing off from MIN_POLL to DEFAULT_POLL"""
+        if no_implicit:
+            with self.implicit_wait_suspended():
+                return self._poll(condition, timeout)
+        
+        deadline = time.monotonic() + timeout
+        interval = self.MIN_POLL
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except (NoSuchElementException, StaleElementReferenceException):
+                # The element was re-rendered between find and check - look it up again
+                pass
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(f"Condition not met within {timeout}s")
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.BACKOFF, self.DEFAULT_POLL)
+    
+    @staticmethod
+    def _spec(condition_type: str, locator: Optional[Tuple[str, str]] = None, expected=None) -> Dict:
+        """Condition description understood by WAIT_FOR_JS"""
+        spec = {"type": condition_type, "expected": expected}
+        if locator is not None:
+            spec["using"], spec["value"] = locator
+        return spec
+    
+    @contextmanager
+    def implicit_wait_suspended(self):
+        """
+        Turn the implicit wait off for the duration of the block
+        Every find inside an explicit wait would otherwise block for the
+        full implicit wait first, stacking both timeouts
+        """
+        self.driver.implicitly_wait(0)
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(config.implicit_wait)
     
     def wait_for_element_visible(self, locator: Tuple[str, str]) -> WebElement:
         """Wait for element to be visible and return it"""
-        return self.wait.until(EC.visibility_of_element_located(locator))
+        return self._until(EC.visibility_of_element_located(locator), locator,
+                           spec=self._spec("visible", locator))
     
     def wait_for_element_clickable(self, locator: Tuple[str, str]) -> WebElement:
         """Wait for element to be clickable and return it"""
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        return self._until(EC.element_to_be_clickable(locator), locator,
+                           spec=self._spec("clickable", locator))
     
     def wait_for_element_present(self, locator: Tuple[str, str]) -> WebElement:
         """Wait for element to be present in DOM"""
-        return self.wait.until(EC.presence_of_element_located(locator))
+        return self._until(EC.presence_of_element_located(locator), locator,
+                           spec=self._spec("present", locator))
     
     def wait_for_elements_visible(self, locator: Tuple[str, str]) -> List[WebElement]:
         """Wait for all elements to be visible"""
-        return self.wait.until(EC.visibility_of_all_elements_located(locator))
+        return self._until(EC.visibility_of_all_elements_located(locator), locator,
+                           spec=self._spec("all_visible", locator))
     
     def wait_for_element_invisible(self, locator: Tuple[str, str]) -> bool:
         """Wait for element to become invisible"""
-        return self.wait.until(EC.invisibility_of_element_located(locator))
+        return self._until(EC.invisibility_of_element_located(locator), locator,
+                           spec=self._spec("invisible", locator))
     
     def wait_for_text_present(self, locator: Tuple[str, str], text: str) -> bool:
         """Wait for specific text to be present in element"""
-        return self.wait.until(EC.text_to_be_present_in_element(locator, text))
+        return self._until(EC.text_to_be_present_in_element(locator, text), locator,
+                           spec=self._spec("text_contains", locator, text))
     
     def wait_for_url_contains(self, url_part: str) -> bool:
         """Wait for URL to contain specific text"""
-        return self.wait.until(EC.url_contains(url_part))
+        return self._until(EC.url_contains(url_part), spec=self._spec("url_contains", expected=url_part))
     
     def wait_for_url_to_be(self, url: str) -> bool:
         """Wait for URL to be exactly as specified"""
-        return self.wait.until(EC.url_to_be(url))
+        return self._until(EC.url_to_be(url), spec=self._spec("url_to_be", expected=url))
+    
+    def wait_for_element_count(self, locator: Tuple[str, str], count: int) -> bool:
+        """Wait until exactly `count` elements match the locator"""
+        return self._until(lambda driver: len(driver.find_elements(*locator)) == count, locator,
+                           spec=self._spec("count", locator, count), no_implicit=True)
+    
+    def wait_for_text_to_be(self, locator: Tuple[str, str], text: str) -> bool:
+        """Wait for the first matching element's text to equal `text` exactly"""
+        def text_matches(driver):
+            elements = driver.find_elements(*locator)
+            try:
+                return bool(elements) and elements[0].text == text
+            except StaleElementReferenceException:
+                return False
+        
+        return self._until(text_matches, locator, spec=self._spec("text_to_be", locator, text), no_implicit=True)
+    
+    # =============== NEGATIVE / SHORT WAITS ===============
+    
+    def is_element_visible_within(self, locator: Tuple[str, str], timeout: float) -> bool:
+        """Check visibility, waiting at most `timeout` seconds with implicit wait suspended"""
+        try:
+            self._until(EC.visibility_of_element_located(locator), locator, timeout,
+                        spec=self._spec("visible", locator), no_implicit=True)
+            return True
+        except TimeoutException:
+            return False
+    
+    def wait_for_element_absent(self, locator: Tuple[str, str], timeout: Optional[float] = None) -> bool:
+        """
+        Wait until no element matches the locator
+        Defaults to the short negative_wait and returns as soon as the element is gone
+        """
+        if timeout is None:
+            timeout = config.negative_wait
+        return self._until(lambda driver: len(driver.find_elements(*locator)) == 0, locator, timeout,
+                           spec=self._spec("count", locator, 0), no_implicit=True)